@@ -13,6 +13,27 @@ from typing import Dict, Any, Optional, Tuple, List, Callable, Union
 # Set up module-level logger
 logger = logging.getLogger("edgeprompt.runner.json_utils")
 
+# Extraction patterns tried in order by extract_json_from_text, compiled once
+_EXTRACTION_PATTERNS = tuple((re.compile(pattern, re.DOTALL), method) for pattern, method in (
+    # Code blocks with or without language specifier
+    (r'```(?:json)?\s*([\s\S]*?)```', "markdown_code_block"),
+    (r'```\s*([\s\S]*?)```', "markdown_code_block"),
+    
+    # Single backtick code (inline code)
+    (r'`([\s\S]*?)`', "inline_code"),
+    
+    # Just a JSON object in the text
+    (r'(\{[\s\S]*?\})', "json_object"),
+    
+    # Key-value pairs (output of some models)
+    (r'(?:[\r\n]|^)((?:(?:"?[a-zA-Z_][a-zA-Z0-9_]*"?\s*:\s*(?:"[^"]*"|\'[^\']*\'|true|false|null|-?\d+(?:\.\d+)?|undefined)[\s,]*)+))', "key_value_pairs")
+))
+
+# Clean-up rewrites applied to extracted text that fails to parse
+_SINGLE_QUOTED_RE = re.compile(r'\'([^\']*?)\'')
+_UNQUOTED_KEY_RE = re.compile(r'([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:')
+_TRAILING_COMMA_RE = re.compile(r',\s*([}\]])')
+
 def extract_json_from_text(text: str) -> Tuple[Optional[Dict[str, Any]], str]:
     """
     Robustly extract and parse JSON from text that may contain markdown, code blocks, or other formatting.
@@ -37,26 +58,10 @@ def extract_json_from_text(text: str) -> Tuple[Optional[Dict[str, Any]], str]:
     except json.JSONDecodeError:
         logger.debug("Direct JSON parsing failed, attempting extraction...")
     
-    # Try various extraction patterns
-    extraction_patterns = [
-        # Code blocks with or without language specifier
-        (r'```(?:json)?\s*([\s\S]*?)```', "markdown_code_block"),
-        (r'```\s*([\s\S]*?)```', "markdown_code_block"),
-        
-        # Single backtick code (inline code)
-        (r'`([\s\S]*?)`', "inline_code"),
-        
-        # Just a JSON object in the text
-        (r'(\{[\s\S]*?\})', "json_object"),
-        
-        # Key-value pairs (output of some models)
-        (r'(?:[\r\n]|^)((?:(?:"?[a-zA-Z_][a-zA-Z0-9_]*"?\s*:\s*(?:"[^"]*"|\'[^\']*\'|true|false|null|-?\d+(?:\.\d+)?|undefined)[\s,]*)+))', "key_value_pairs")
-    ]
-    
     # Try each extraction pattern
-    for pattern, method in extraction_patterns:
+    for pattern, method in _EXTRACTION_PATTERNS:
         try:
-            matches = re.findall(pattern, text, re.DOTALL)
+            matches = pattern.findall(text)
             
             # Try each match (if multiple)
             for match in matches:
@@ -85,13 +90,13 @@ def extract_json_from_text(text: str) -> Tuple[Optional[Dict[str, Any]], str]:
                     # This match didn't work, try to clean it up
                     try:
                         # Replace single quotes with double quotes around keys and string values
-                        fixed_text = re.sub(r'\'([^\']*?)\'', r'"\1"', extracted_text)
+                        fixed_text = _SINGLE_QUOTED_RE.sub(r'"\1"', extracted_text)
                         # Add quotes to unquoted keys
-                        fixed_text = re.sub(r'([{,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', r'\1"\2":', fixed_text)
+                        fixed_text = _UNQUOTED_KEY_RE.sub(r'\1"\2":', fixed_text)
                         # Fix True/False to true/false
                         fixed_text = fixed_text.replace("True", "true").replace("False", "false")
                         # Remove trailing commas
-                        fixed_text = re.sub(r',\s*([}\]])', r'\1', fixed_text)
+                        fixed_text = _TRAILING_COMMA_RE.sub(r'\1', fixed_text)
                         
                         parsed_json = json.loads(fixed_text)
                         logger.debug(f"Extracted and fixed JSON using method: {method}_fixed")
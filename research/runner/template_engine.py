@@ -118,12 +118,11 @@ class TemplateEngine:
         # Replace the original variables with our processed ones that include defaults
         variables = substitution_vars
 
-        # Perform substitution
+        # Perform substitution in a single pass over the pattern. VAR_PATTERN only
+        # matches names collected above, so every match has a substitution value.
         try:
-            for var_name in found_vars_in_pattern:
-                value_str = str(variables.get(var_name, "")) # Default to empty string if somehow still missing
-                placeholder = f"[{var_name}]"
-                processed_prompt = processed_prompt.replace(placeholder, value_str)
+            value_strs = {var_name: str(value) for var_name, value in variables.items()}
+            processed_prompt = self.VAR_PATTERN.sub(lambda m: value_strs[m.group(1)], pattern)
         except Exception as e:
             error_msg = f"Error during variable substitution for template {template_id}: {str(e)}"
             self.logger.error(error_msg, exc_info=True)
@@ -7,20 +7,98 @@ generates processed datasets for visualization.
 """
 
 import os
+import re
 import sys
 import json
 import logging
 import argparse
-from typing import Dict, Any, List, Optional
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 # Add parent directory to path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+# Test suite names recognised in result file paths
+KNOWN_TEST_SUITES = frozenset({
+    'multi_stage_validation', 'neural_symbolic_validation', 'resource_optimization', 'four_run_comparison'
+})
+
+# Identifier columns carried through from each four-run record
+RUN_IDENTIFIER_COLUMNS = ('id', 'test_case_id', 'cloud_llm_model_id', 'edge_llm_model_id', 'hardware_profile')
+
+# Nested fields read from each run payload by the four-run analysis
+_RUN_PERFORMANCE_FIELDS = ('output', 'total_metrics.total_tokens', 'total_metrics.latency_ms')
+_RUN_CONSTRAINT_FIELDS = ('steps.constraint_enforcement.passed', 'steps.constraint_enforcement.violations', 'final_decision.final_score')
+FOUR_RUN_FIELDS = {
+    'run_1': _RUN_PERFORMANCE_FIELDS,
+    'run_2': _RUN_PERFORMANCE_FIELDS,
+    'run_3': _RUN_PERFORMANCE_FIELDS + _RUN_CONSTRAINT_FIELDS + ('final_decision.passed_evaluation',),
+    'run_4': _RUN_PERFORMANCE_FIELDS + _RUN_CONSTRAINT_FIELDS + ('final_decision.passed_validation',),
+}
+
+# Comparison metric columns written to each per-metric comparison CSV
+COMPARISON_TABLES = {
+    'edgeprompt_vs_baseline_safety': (
+        'safety_violation_rate_run4', 'safety_violation_rate_run3', 'safety_rate_difference_run4_vs_run3'
+    ),
+    'edgeprompt_vs_baseline_constraint': (
+        'constraint_pass_rate_run4', 'constraint_pass_rate_run3', 'constraint_rate_difference_run4_vs_run3'
+    ),
+    'edgeprompt_vs_baseline_token_usage': (
+        'avg_tokens_run4', 'avg_tokens_run3', 'token_ratio_run4_vs_run3', 'token_difference_run4_vs_run3',
+        'avg_tokens_run1', 'token_ratio_run3_vs_run1', 'token_ratio_run4_vs_run1'
+    ),
+    'edgeprompt_vs_baseline_latency': (
+        'avg_latency_run4', 'avg_latency_run3', 'latency_ratio_run4_vs_run3', 'latency_difference_run4_vs_run3',
+        'avg_latency_run1', 'latency_ratio_run3_vs_run1', 'latency_ratio_run4_vs_run1'
+    ),
+}
+
+# Constraint violation text counted as a safety violation, compiled once
+_PROHIBITED_RE = re.compile(r'prohibited keyword', re.IGNORECASE)
+
+# Low-cardinality identifier columns stored as categoricals after loading
+CATEGORICAL_COLUMNS = (
+    'test_suite_id', 'hardware_profile', 'model_id', 'cloud_llm_model_id', 'edge_llm_model_id',
+    'llm_l_model_id', 'llm_s_model_id', 'template_id'
+)
+
+# Test suite partitions read by each analysis type (see load_results_by_suite)
+ANALYSIS_SUITES = {
+    'four_run_comparison': ('four_run_comparison',),
+    'multi_stage': ('multi_stage_validation',),
+    'resource': ('resource_optimization',),
+}
+
+# Minimum number of per-file results before parsing moves to a process pool
+PARALLEL_PARSE_MIN_FILES = 256
+
+# Number of raw records per suite normalized at a time by load_results_by_suite
+NORMALIZE_CHUNK_SIZE = 50_000
+
+# Logger configured by setup_logging, reused on repeated calls (e.g. notebooks)
+_LOGGER: Optional[logging.Logger] = None
+
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Configure logging for the analyzer"""
+    global _LOGGER
+    if _LOGGER is not None:
+        return _LOGGER
+
     log_level_map = {
         'DEBUG': logging.DEBUG,
         'INFO': logging.INFO,
@@ -36,78 +114,317 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     )
     
     # Create logger
-    logger = logging.getLogger('edgeprompt.analyze')
-    return logger
+    _LOGGER = logging.getLogger('edgeprompt.analyze')
+    return _LOGGER
+
+def _safe_ratio(numerator: pd.Series, denominator: pd.Series) -> np.ndarray:
+    """
+    Divide two aggregate columns element-wise in a single numpy pass.
+
+    A zero denominator is treated as 1 (the numerator is returned unchanged)
+    so missing runs don't produce inf values in the comparison CSVs.
+    """
+    den = denominator.to_numpy(dtype=np.float64)
+    return numerator.to_numpy(dtype=np.float64) / np.where(den == 0, 1.0, den)
+
+def write_table(df: pd.DataFrame, output_dir: str, name: str, logger: logging.Logger,
+                float_format: Optional[str] = None, parquet_dtypes: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Write a processed table as CSV and, when pyarrow is available, as Parquet.
+
+    The CSV is kept for human inspection; the Parquet copy (zstd compressed)
+    is what render_figures.py prefers to read, avoiding float-to-text
+    conversion and re-parsing downstream. parquet_dtypes narrows columns of
+    the Parquet copy only; the CSV is written from df as is.
+
+    Returns:
+        Path of the CSV file written.
+    """
+    csv_file = os.path.join(output_dir, f'{name}.csv')
+    df.to_csv(csv_file, index=False, float_format=float_format)
+    if pyarrow is not None:
+        parquet_file = os.path.join(output_dir, f'{name}.parquet')
+        try:
+            stored = df.astype(parquet_dtypes) if parquet_dtypes else df
+            stored.to_parquet(parquet_file, engine='pyarrow', compression='zstd', index=False)
+        except (ValueError, TypeError, OSError, pyarrow.ArrowException) as e:
+            logger.warning("Could not write %s: %s", parquet_file, e)
+    return csv_file
+
+def _write_comparison_csv(agg_df: pd.DataFrame, grouping_factors: List[str], output_dir: str, name: str) -> str:
+    """
+    Write one comparison table as a CSV projection of the aggregated metrics.
+
+    Only the CSV is written; the Parquet copy of the aggregated table holds
+    every comparison column, so render_figures.py reads them from there.
+    """
+    csv_file = os.path.join(output_dir, f'{name}.csv')
+    agg_df[grouping_factors + list(COMPARISON_TABLES[name])].to_csv(csv_file, index=False, float_format='%.2f')
+    return csv_file
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available, falling back to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump can emit
+            pass
+    return json.loads(data)
+
+def _column(df: pd.DataFrame, name: str, default: Any) -> pd.Series:
+    """Return a column of df, or one filled with default if the field was never recorded."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+def _prohibited_keyword_flags(violations: pd.Series) -> pd.Series:
+    """
+    Flag rows whose constraint-violation list contains a prohibited keyword hit.
+
+    All lists are exploded into one column so the case-insensitive substring
+    test runs once over every violation instead of per row. Entries that are
+    not lists count as no violations.
+    """
+    is_list = np.fromiter((isinstance(v, list) for v in violations), dtype=bool, count=len(violations))
+    exploded = violations.reset_index(drop=True).where(is_list, None).explode()
+    hits = exploded.astype(str).str.contains(_PROHIBITED_RE, na=False)
+    return pd.Series(hits.groupby(level=0).any().to_numpy(), index=violations.index)
+
+def _flatten_run_fields(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Flatten nested run payloads into the dotted columns read by the four-run analysis.
+
+    Only the fields listed in FOUR_RUN_FIELDS are pulled out, in one pass over
+    each run column, instead of json_normalize materializing every nested
+    field of every record.
+
+    Args:
+        df: DataFrame whose run_N columns hold run result dicts
+
+    Returns:
+        DataFrame with the identifier columns and one column per run field
+    """
+    have = set(df.columns)
+    columns = {key: df[key] for key in RUN_IDENTIFIER_COLUMNS if key in have}
+    for run_key, fields in FOUR_RUN_FIELDS.items():
+        if run_key not in have:
+            continue
+        payloads = df[run_key].tolist()
+        for field in fields:
+            path = field.split('.')
+            values = []
+            append = values.append
+            for value in payloads:
+                for part in path:
+                    if not isinstance(value, dict):
+                        value = None
+                        break
+                    value = value.get(part)
+                append(value)
+            columns[f'{run_key}.{field}'] = values
+    return pd.DataFrame(columns, index=df.index)
+
+def _iter_json_paths(directory: str) -> Iterator[str]:
+    """
+    Yield paths of JSON files under a directory (recursively).
+
+    Args:
+        directory: Directory to scan
+
+    Yields:
+        Paths of *.json files
+    """
+    try:
+        scanner = os.scandir(directory)
+    except FileNotFoundError:
+        return
+        
+    # DirEntry carries the dirent type, so no extra stat per entry
+    with scanner:
+        for entry in scanner:
+            if entry.is_dir(follow_symlinks=False):
+                # Process subdirectories for test suite results
+                yield from _iter_json_paths(entry.path)
+            elif entry.name.endswith('.json'):
+                yield entry.path
+
+def _parse_result_file(path: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+    """
+    Parse one result file; runs in worker processes, so it must not log.
+
+    Args:
+        path: Path of the JSON file
+
+    Returns:
+        (parsed_ok, record) where record is None for files without the
+        expected result structure
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = _loads(f.read())
+    except ValueError:
+        return False, None
+    # Only add result files that have the expected structure
+    if not (isinstance(data, dict) and any(key in data for key in ['id', 'test_case_id', 'model_id'])):
+        return True, None
+    # Add test_suite_id if missing by inferring from path
+    if 'test_suite_id' not in data:
+        suite = next((part for part in path.split(os.sep) if part in KNOWN_TEST_SUITES), None)
+        if suite is not None:
+            data['test_suite_id'] = suite
+    return True, data
+
+def _iter_json_files(directory: str, logger: logging.Logger) -> Iterator[Dict[str, Any]]:
+    """
+    Yield result records from individual JSON files under a directory (recursively).
+
+    Large directories are parsed across a process pool, since decoding
+    thousands of files is CPU-bound and independent per file.
+
+    Args:
+        directory: Directory to scan
+        logger: Logger instance
+
+    Yields:
+        Result records, with test_suite_id inferred from the path if missing
+    """
+    paths = list(_iter_json_paths(directory))
+    if len(paths) < PARALLEL_PARSE_MIN_FILES:
+        parsed = zip(paths, map(_parse_result_file, paths))
+        executor = None
+    else:
+        logger.debug("Parsing %d result files across worker processes", len(paths))
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        parsed = zip(paths, executor.map(_parse_result_file, paths, chunksize=64))
+
+    try:
+        for path, (parsed_ok, data) in parsed:
+            if not parsed_ok:
+                logger.warning("Skipping invalid JSON file: %s", path)
+            elif data is not None:
+                yield data
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-def load_results(data_dir: str, logger: logging.Logger) -> pd.DataFrame:
+def iter_results(data_dir: str, logger: logging.Logger) -> Iterator[Dict[str, Any]]:
     """
-    Load all results from JSONL files into a pandas DataFrame.
+    Stream parsed result records from a raw data directory.
+
+    Reads all_results.jsonl when present; if it is missing or yields no valid
+    records, falls back to the individual JSON files in data_dir and its
+    subdirectories.
     
     Args:
         data_dir: Directory containing raw data files
         logger: Logger instance
     
-    Returns:
-        DataFrame with all results
+    Yields:
+        Parsed result records
     """
-    results = []
+    found = False
     
     # Check for JSONL file first (most efficient)
     jsonl_path = os.path.join(data_dir, "all_results.jsonl")
     if os.path.exists(jsonl_path):
-        logger.info(f"Loading results from {jsonl_path}")
-        with open(jsonl_path, 'r') as f:
+        logger.info("Loading results from %s", jsonl_path)
+        # Bind the decoder locally for the hot per-line loop
+        loads = _loads
+        with open(jsonl_path, 'rb') as f:
             for line in f:
                 try:
-                    results.append(json.loads(line))
-                except json.JSONDecodeError:
-                    logger.warning(f"Skipping invalid JSON line in {jsonl_path}")
+                    record = loads(line)
+                except ValueError:
+                    logger.warning("Skipping invalid JSON line in %s", jsonl_path)
+                    continue
+                found = True
+                yield record
                     
     # If no JSONL or no results, try individual JSON files (both in data_dir and subdirectories)
-    if not results:
-        logger.info(f"No JSONL file found, checking individual JSON files in {data_dir} and subdirectories")
-        
-        # Function to process JSON files in a directory
-        def process_json_files(directory):
-            nonlocal results
-            if not os.path.exists(directory):
-                return
-                
-            for item in os.listdir(directory):
-                full_path = os.path.join(directory, item)
-                if os.path.isdir(full_path):
-                    # Process subdirectories for test suite results
-                    process_json_files(full_path)
-                elif item.endswith('.json'):
-                    try:
-                        with open(full_path, 'r') as f:
-                            data = json.load(f)
-                            # Only add result files that have the expected structure
-                            if isinstance(data, dict) and any(key in data for key in ['id', 'test_case_id', 'model_id']):
-                                # Add test_suite_id if missing by inferring from path
-                                if 'test_suite_id' not in data:
-                                    path_parts = full_path.split(os.sep)
-                                    # Try to find known test suite names in the path
-                                    for part in path_parts:
-                                        if part in ['multi_stage_validation', 'neural_symbolic_validation', 'resource_optimization', 'four_run_comparison']:
-                                            data['test_suite_id'] = part
-                                            break
-                                results.append(data)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Skipping invalid JSON file: {full_path}")
-        
-        # Process the data directory and its subdirectories
-        process_json_files(data_dir)
+    if not found:
+        logger.info("No JSONL file found, checking individual JSON files in %s and subdirectories", data_dir)
+        yield from _iter_json_files(data_dir, logger)
+
+def _combine_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate normalized frames and convert identifiers to categoricals."""
+    df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    # Low-cardinality identifiers become categoricals so groupby hashes codes
+    have = set(df.columns)
+    for col in CATEGORICAL_COLUMNS:
+        if col in have and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+def _record_suite(record: Dict[str, Any]) -> str:
+    """
+    Test suite of a raw record: test_suite_id, else a known suite name
+    contained in the run id (the rule the analyzers used to filter on), or ''.
+    """
+    suite = record.get('test_suite_id')
+    if suite:
+        return str(suite)
+    run_id = str(record.get('id', ''))
+    return next((name for name in KNOWN_TEST_SUITES if name in run_id), '')
+
+def load_results_by_suite(data_dir: str, logger: logging.Logger) -> Dict[str, pd.DataFrame]:
+    """
+    Load results partitioned by test suite.
+
+    Records are grouped on their suite while streaming and each partition is
+    normalized separately, so an analyzer only pays for the columns of the
+    suites it reads (see ANALYSIS_SUITES). Each partition is normalized in
+    chunks of NORMALIZE_CHUNK_SIZE records, so the raw dicts of a chunk are
+    released before the next one fills up. Records whose suite cannot be
+    determined are kept under the '' key.
     
-    logger.info(f"Loaded {len(results)} results")
+    Args:
+        data_dir: Directory containing raw data files
+        logger: Logger instance
     
-    if not results:
+    Returns:
+        Dict mapping suite name to a DataFrame of its results
+    """
+    frames: Dict[str, List[pd.DataFrame]] = defaultdict(list)
+    chunks: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    total = 0
+    record_suite = _record_suite
+
+    for record in iter_results(data_dir, logger):
+        suite = record_suite(record)
+        chunk = chunks[suite]
+        chunk.append(record)
+        if len(chunk) >= NORMALIZE_CHUNK_SIZE:
+            frames[suite].append(pd.json_normalize(chunk))
+            total += len(chunk)
+            chunks[suite] = []
+    for suite, chunk in chunks.items():
+        if chunk:
+            frames[suite].append(pd.json_normalize(chunk))
+            total += len(chunk)
+
+    logger.info("Loaded %d results across %d test suites", total, len(frames))
+    if not frames:
         logger.warning("No results found!")
+    return {suite: _combine_frames(suite_frames) for suite, suite_frames in frames.items()}
+
+def select_suites(partitions: Dict[str, pd.DataFrame], analysis_type: str) -> pd.DataFrame:
+    """
+    Combine the partitions an analysis reads, plus records of unknown suite.
+
+    Args:
+        partitions: Output of load_results_by_suite
+        analysis_type: Key of ANALYSIS_SUITES
+
+    Returns:
+        DataFrame of the selected results (empty if none)
+    """
+    suites = ANALYSIS_SUITES[analysis_type] + ('',)
+    frames = [partitions[suite] for suite in suites if suite in partitions]
+    if not frames:
         return pd.DataFrame()
-    
-    # Convert to DataFrame
-    df = pd.json_normalize(results)
-    return df
+    return _combine_frames(frames)
 
 def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: logging.Logger) -> None:
     """
@@ -125,35 +442,39 @@ def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: loggi
     """
     logger.info("Starting Four-Run Comparison Analysis...")
 
-    # Ensure output directory exists
-    try:
-        os.makedirs(output_dir, exist_ok=True)
-    except OSError as e:
-        logger.error(f"Failed to create output directory {output_dir}: {e}")
-        return # Cannot proceed without output directory
+    if df.empty:
+        logger.warning("No results available for four-run comparison. Skipping.")
+        return
 
     # Filter DataFrame for relevant rows (containing all runs)
     # Check if run data is nested or already flattened
-    if 'run_1.status' in df.columns and 'run_3.status' in df.columns and 'run_4.status' in df.columns:
-        # Data seems already normalized/flattened
-        four_run_df = df.copy()
-        logger.debug(f"Found {len(four_run_df)} rows with flattened run data.")
-    elif 'run_1' in df.columns and 'run_3' in df.columns and 'run_4' in df.columns:
+    run_keys = ('run_1', 'run_3', 'run_4')
+    columns = set(df.columns)
+    if {f'{key}.status' for key in run_keys}.issubset(columns):
+        # Data seems already normalized/flattened; the extraction below only
+        # reads columns, so no defensive copy is needed
+        four_run_df = df
+        logger.debug("Found %d rows with flattened run data.", len(four_run_df))
+    elif columns.issuperset(run_keys):
          # Data needs normalization from nested dicts
          try:
-             # Check if columns contain dicts or potentially JSON strings
-             if isinstance(df['run_1'].iloc[0], str):
-                  df['run_1'] = df['run_1'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-             if isinstance(df['run_3'].iloc[0], str):
-                  df['run_3'] = df['run_3'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-             if isinstance(df['run_4'].iloc[0], str):
-                  df['run_4'] = df['run_4'].apply(lambda x: json.loads(x) if isinstance(x, str) else x)
-
-             # Normalize nested data
-             four_run_df = pd.json_normalize(df.to_dict('records'), sep='.')
-             logger.debug(f"Normalized nested run data. Resulting columns: {four_run_df.columns.tolist()}")
+             # Decode columns holding JSON strings without touching the caller's frame
+             decoded = {
+                 key: df[key].map(json.loads, na_action='ignore')
+                 for key in FOUR_RUN_FIELDS
+                 if key in columns and pd.api.types.infer_dtype(df[key], skipna=True) == 'string'
+             }
+             # Select only the identifier and run columns instead of copying
+             # every column of the caller's frame through assign()
+             nested_df = df[[key for key in (*RUN_IDENTIFIER_COLUMNS, *FOUR_RUN_FIELDS) if key in columns]]
+             if decoded:
+                 nested_df = nested_df.assign(**decoded)
+
+             # Flatten only the nested fields the extraction below reads
+             four_run_df = _flatten_run_fields(nested_df)
+             logger.debug("Flattened nested run data. Resulting columns: %s", four_run_df.columns.tolist())
          except Exception as e:
-             logger.error(f"Error normalizing nested run data: {e}", exc_info=True)
+             logger.error("Error normalizing nested run data: %s", e, exc_info=True)
              return
     else:
          logger.warning("Could not find 'run_1', 'run_3' and 'run_4' columns/data for analysis. Skipping.")
@@ -162,99 +483,118 @@ def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: loggi
     if four_run_df.empty:
         logger.warning("No four-run comparison results found after filtering/normalization. Skipping.")
         return
+
+    # Ensure output directory exists
+    try:
+        os.makedirs(output_dir, exist_ok=True)
+    except OSError as e:
+        logger.error("Failed to create output directory %s: %s", output_dir, e)
+        return # Cannot proceed without output directory
         
-    logger.info(f"Processing {len(four_run_df)} four-run comparison results entries.")
+    logger.info("Processing %d four-run comparison results entries.", len(four_run_df))
     
     # --- Extract Key Metrics Per Run --- 
-    # Initialize list to store extracted data for each run
-    detailed_comparison_records = []
-
-    for _, row in four_run_df.iterrows():
-        record = {
-            # Identifiers
-            'run_id': row.get('id', 'unknown'),
-            'test_case_id': row.get('test_case_id', 'unknown'),
-            'cloud_llm_model_id': row.get('cloud_llm_model_id', 'unknown'),
-            'edge_llm_model_id': row.get('edge_llm_model_id', 'unknown'),
-            'hardware_profile': row.get('hardware_profile', 'unknown')
-        }
+    # Each metric is pulled out as a whole column; rows missing a field fall
+    # back to the same defaults the per-record extraction used
+    # 0/1 flags are boolean masks reinterpreted in place as int8 (no int64 copy)
+    def flag(name: str) -> np.ndarray:
+        return _column(four_run_df, name, False).eq(True).to_numpy(dtype=bool).view(np.int8)
+
+    def numeric(name: str) -> pd.Series:
+        return pd.to_numeric(_column(four_run_df, name, np.nan), errors='coerce')
+
+    def safety_violations(name: str) -> np.ndarray:
+        return _prohibited_keyword_flags(_column(four_run_df, name, None)).to_numpy(dtype=bool).view(np.int8)
+
+    detailed_df = pd.DataFrame({
+        # Identifiers
+        'run_id': _column(four_run_df, 'id', 'unknown'),
+        'test_case_id': _column(four_run_df, 'test_case_id', 'unknown'),
+        'cloud_llm_model_id': _column(four_run_df, 'cloud_llm_model_id', 'unknown'),
+        'edge_llm_model_id': _column(four_run_df, 'edge_llm_model_id', 'unknown'),
+        'hardware_profile': _column(four_run_df, 'hardware_profile', 'unknown'),
 
         # --- Run 4 Metrics (EdgePrompt) --- 
         # Safety (derived from constraints)
-        run4_constraint_violations = row.get('run_4.steps.constraint_enforcement.violations', [])
-        # Ensure violations is a list before processing
-        if not isinstance(run4_constraint_violations, list):
-             run4_constraint_violations = [] 
-        record['safety_violation_run4'] = int(any("prohibited keyword" in str(v).lower() for v in run4_constraint_violations))
+        'safety_violation_run4': safety_violations('run_4.steps.constraint_enforcement.violations'),
         # Constraint Adherence
-        record['constraint_passed_run4'] = int(row.get('run_4.steps.constraint_enforcement.passed', False))
+        'constraint_passed_run4': flag('run_4.steps.constraint_enforcement.passed'),
         # Validation
-        record['validation_passed_run4'] = int(row.get('run_4.final_decision.passed_validation', False))
-        record['validation_score_run4'] = pd.to_numeric(row.get('run_4.final_decision.final_score'), errors='coerce')
+        'validation_passed_run4': flag('run_4.final_decision.passed_validation'),
+        'validation_score_run4': numeric('run_4.final_decision.final_score'),
         # Performance
-        record['total_tokens_run4'] = pd.to_numeric(row.get('run_4.total_metrics.total_tokens'), errors='coerce')
-        record['latency_ms_run4'] = pd.to_numeric(row.get('run_4.total_metrics.latency_ms'), errors='coerce')
+        'total_tokens_run4': numeric('run_4.total_metrics.total_tokens'),
+        'latency_ms_run4': numeric('run_4.total_metrics.latency_ms'),
         # Output for quality comparison
-        record['output_run4'] = row.get('run_4.output', '')
+        'output_run4': _column(four_run_df, 'run_4.output', ''),
 
         # --- Run 3 Metrics (Edge Baseline) ---
         # Safety (derived from constraints)
-        run3_constraint_violations = row.get('run_3.steps.constraint_enforcement.violations', [])
-        if not isinstance(run3_constraint_violations, list):
-             run3_constraint_violations = []
-        record['safety_violation_run3'] = int(any("prohibited keyword" in str(v).lower() for v in run3_constraint_violations))
+        'safety_violation_run3': safety_violations('run_3.steps.constraint_enforcement.violations'),
         # Constraint Adherence
-        record['constraint_passed_run3'] = int(row.get('run_3.steps.constraint_enforcement.passed', False))
+        'constraint_passed_run3': flag('run_3.steps.constraint_enforcement.passed'),
         # Baseline Evaluation (use this for Run 3's pass/score)
-        record['evaluation_passed_run3'] = int(row.get('run_3.final_decision.passed_evaluation', False))
-        record['evaluation_score_run3'] = pd.to_numeric(row.get('run_3.final_decision.final_score'), errors='coerce')
+        'evaluation_passed_run3': flag('run_3.final_decision.passed_evaluation'),
+        'evaluation_score_run3': numeric('run_3.final_decision.final_score'),
         # Performance
-        record['total_tokens_run3'] = pd.to_numeric(row.get('run_3.total_metrics.total_tokens'), errors='coerce')
-        record['latency_ms_run3'] = pd.to_numeric(row.get('run_3.total_metrics.latency_ms'), errors='coerce')
+        'total_tokens_run3': numeric('run_3.total_metrics.total_tokens'),
+        'latency_ms_run3': numeric('run_3.total_metrics.latency_ms'),
         # Output for quality comparison
-        record['output_run3'] = row.get('run_3.output', '')
-        
+        'output_run3': _column(four_run_df, 'run_3.output', ''),
+
         # --- Run 1 Metrics (Cloud Reference) ---
         # Reference Data
-        record['total_tokens_run1'] = pd.to_numeric(row.get('run_1.total_metrics.total_tokens'), errors='coerce')
-        record['latency_ms_run1'] = pd.to_numeric(row.get('run_1.total_metrics.latency_ms'), errors='coerce')
-        record['output_run1'] = row.get('run_1.output', '')
-        
+        'total_tokens_run1': numeric('run_1.total_metrics.total_tokens'),
+        'latency_ms_run1': numeric('run_1.total_metrics.latency_ms'),
+        'output_run1': _column(four_run_df, 'run_1.output', ''),
+
         # --- Run 2 Metrics (Cloud EdgePrompt) ---
         # Just include basic metrics for potential future use
-        record['total_tokens_run2'] = pd.to_numeric(row.get('run_2.total_metrics.total_tokens'), errors='coerce')
-        record['latency_ms_run2'] = pd.to_numeric(row.get('run_2.total_metrics.latency_ms'), errors='coerce')
-        record['output_run2'] = row.get('run_2.output', '')
+        'total_tokens_run2': numeric('run_2.total_metrics.total_tokens'),
+        'latency_ms_run2': numeric('run_2.total_metrics.latency_ms'),
+        'output_run2': _column(four_run_df, 'run_2.output', ''),
+    }).reset_index(drop=True)
 
-        detailed_comparison_records.append(record)
-
-    if not detailed_comparison_records:
+    if detailed_df.empty:
         logger.warning("No detailed comparison records generated. Cannot proceed with aggregation.")
         return
     
-    # --- Create Detailed DataFrame --- 
-    detailed_df = pd.DataFrame(detailed_comparison_records)
-    
-    # Handle potential NaN values resulting from coerce errors or missing data
-    numeric_cols = [
-        'safety_violation_run4', 'constraint_passed_run4', 'validation_passed_run4', 'validation_score_run4', 'total_tokens_run4', 'latency_ms_run4',
-        'safety_violation_run3', 'constraint_passed_run3', 'evaluation_passed_run3', 'evaluation_score_run3', 'total_tokens_run3', 'latency_ms_run3',
-        'total_tokens_run1', 'latency_ms_run1', 'total_tokens_run2', 'latency_ms_run2'
-    ]
-    for col in numeric_cols:
-        if col in detailed_df.columns:
-            detailed_df[col] = detailed_df[col].fillna(0)
+    # Handle potential NaN values resulting from coerce errors or missing data,
+    # then narrow each metric: 0/1 flags fit in int8 and token counts in int32.
+    # Scores and latencies stay float64 so the aggregated sums and means keep
+    # full precision; they are only narrowed to float32 in the Parquet copy.
+    metric_dtypes = {
+        'safety_violation_run4': np.int8, 'constraint_passed_run4': np.int8, 'validation_passed_run4': np.int8,
+        'validation_score_run4': np.float64, 'total_tokens_run4': np.int32, 'latency_ms_run4': np.float64,
+        'safety_violation_run3': np.int8, 'constraint_passed_run3': np.int8, 'evaluation_passed_run3': np.int8,
+        'evaluation_score_run3': np.float64, 'total_tokens_run3': np.int32, 'latency_ms_run3': np.float64,
+        'total_tokens_run1': np.int32, 'latency_ms_run1': np.float64, 'total_tokens_run2': np.int32, 'latency_ms_run2': np.float64
+    }
+    numeric_cols = list(metric_dtypes)
+    detailed_columns = set(detailed_df.columns)
+    for col, dtype in metric_dtypes.items():
+        if col not in detailed_columns:
+            continue
+        # Missing values always count as 0, even in columns that already have
+        # the target dtype; only the no-op fill and cast are skipped
+        series = detailed_df[col]
+        if series.hasnans:
+            series = series.fillna(0)
+        if series.dtype != dtype:
+            series = series.astype(dtype)
+        detailed_df[col] = series
 
     # Save detailed results
-    detailed_file = os.path.join(output_dir, 'four_run_comparison_detailed.csv')
-    detailed_df.to_csv(detailed_file, index=False)
-    logger.info(f"Saved detailed four-run comparison results to {detailed_file}")
+    float_metrics = [col for col, dtype in metric_dtypes.items() if dtype is np.float64]
+    detailed_file = write_table(detailed_df, output_dir, 'four_run_comparison_detailed', logger,
+                                parquet_dtypes=dict.fromkeys(float_metrics, np.float32))
+    logger.info("Saved detailed four-run comparison results to %s", detailed_file)
 
     # --- Aggregate Results for Visualization --- 
     # Group by relevant factors (cloud_llm_model_id, edge_llm_model_id, hardware_profile)
     grouping_factors = ['cloud_llm_model_id', 'edge_llm_model_id', 'hardware_profile']
     # Check if factors exist
-    valid_grouping_factors = [f for f in grouping_factors if f in detailed_df.columns]
+    valid_grouping_factors = [f for f in grouping_factors if f in detailed_columns]
     if not valid_grouping_factors:
         logger.warning("Cannot group results: Missing grouping columns. Aggregating overall.")
         # Aggregate overall if grouping factors are missing
@@ -270,12 +610,13 @@ def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: loggi
         return # Exit if grouping factors are missing, as the logic below depends on them.
         
     else:
-        logger.info(f"Aggregating results by: {valid_grouping_factors}")
-        # Calculate both mean and sum for rate calculations, count comes along
-        agg_funcs = {col: ['mean', 'sum'] for col in numeric_cols}
-        agg_df = detailed_df.groupby(valid_grouping_factors).agg(agg_funcs)
+        logger.info("Aggregating results by: %s", valid_grouping_factors)
+        # Build the grouping once; it is reused for counts and quality scores below
+        grouped = detailed_df.groupby(valid_grouping_factors, observed=True)
+        # Calculate both mean and sum for rate calculations over the whole numeric block
+        agg_df = grouped[numeric_cols].agg(['mean', 'sum'])
         agg_df.columns = ['_'.join(col).strip() for col in agg_df.columns.values] # Flatten MultiIndex
-        agg_df['count'] = detailed_df.groupby(valid_grouping_factors).size() # Add count separately
+        agg_df['count'] = grouped.size() # Add count separately
         agg_df = agg_df.reset_index()
 
 
@@ -290,84 +631,77 @@ def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: loggi
          logger.error("Aggregation failed to produce a 'count' column. Cannot calculate rates.")
          return
 
+    # The comparison metrics are added to agg_df in place; each comparison CSV
+    # is a projection of it and the aggregated table carries them all
     # Safety Comparison (Violation Rate - Run 4 vs Run 3)
     try:
-        safety_df = agg_df[valid_grouping_factors].copy()
         # Calculate rates using sum / count
-        safety_df['safety_violation_rate_run4'] = (agg_df['safety_violation_run4_sum'] / agg_df['count']) * 100
-        safety_df['safety_violation_rate_run3'] = (agg_df['safety_violation_run3_sum'] / agg_df['count']) * 100
-        safety_df['safety_rate_difference_run4_vs_run3'] = safety_df['safety_violation_rate_run4'] - safety_df['safety_violation_rate_run3']
-        safety_file = os.path.join(output_dir, 'edgeprompt_vs_baseline_safety.csv')
-        safety_df.to_csv(safety_file, index=False, float_format='%.2f')
-        logger.info(f"Saved safety comparison results to {safety_file}")
+        agg_df['safety_violation_rate_run4'] = (agg_df['safety_violation_run4_sum'] / agg_df['count']) * 100
+        agg_df['safety_violation_rate_run3'] = (agg_df['safety_violation_run3_sum'] / agg_df['count']) * 100
+        agg_df['safety_rate_difference_run4_vs_run3'] = agg_df['safety_violation_rate_run4'] - agg_df['safety_violation_rate_run3']
+        safety_file = _write_comparison_csv(agg_df, valid_grouping_factors, output_dir, 'edgeprompt_vs_baseline_safety')
+        logger.info("Saved safety comparison results to %s", safety_file)
     except KeyError as e:
-        logger.warning(f"Could not generate edgeprompt_vs_baseline_safety.csv. Missing column: {e}")
+        logger.warning("Could not generate edgeprompt_vs_baseline_safety.csv. Missing column: %s", e)
     except Exception as e:
-        logger.error(f"Error generating edgeprompt_vs_baseline_safety.csv: {e}", exc_info=True)
+        logger.error("Error generating edgeprompt_vs_baseline_safety.csv: %s", e, exc_info=True)
 
 
     # Constraint Adherence Comparison (Pass Rate - Run 4 vs Run 3)
     try:
-        constraint_df = agg_df[valid_grouping_factors].copy()
          # Calculate rates using sum / count
-        constraint_df['constraint_pass_rate_run4'] = (agg_df['constraint_passed_run4_sum'] / agg_df['count']) * 100
+        agg_df['constraint_pass_rate_run4'] = (agg_df['constraint_passed_run4_sum'] / agg_df['count']) * 100
         # Note: Run 3 uses 'evaluation_passed_run3' as its primary pass metric per extraction logic
-        constraint_df['constraint_pass_rate_run3'] = (agg_df['evaluation_passed_run3_sum'] / agg_df['count']) * 100 
-        constraint_df['constraint_rate_difference_run4_vs_run3'] = constraint_df['constraint_pass_rate_run4'] - constraint_df['constraint_pass_rate_run3']
-        constraint_file = os.path.join(output_dir, 'edgeprompt_vs_baseline_constraint.csv')
-        constraint_df.to_csv(constraint_file, index=False, float_format='%.2f')
-        logger.info(f"Saved constraint comparison results to {constraint_file}")
+        agg_df['constraint_pass_rate_run3'] = (agg_df['evaluation_passed_run3_sum'] / agg_df['count']) * 100 
+        agg_df['constraint_rate_difference_run4_vs_run3'] = agg_df['constraint_pass_rate_run4'] - agg_df['constraint_pass_rate_run3']
+        constraint_file = _write_comparison_csv(agg_df, valid_grouping_factors, output_dir, 'edgeprompt_vs_baseline_constraint')
+        logger.info("Saved constraint comparison results to %s", constraint_file)
     except KeyError as e:
-        logger.warning(f"Could not generate edgeprompt_vs_baseline_constraint.csv. Missing column: {e}")
+        logger.warning("Could not generate edgeprompt_vs_baseline_constraint.csv. Missing column: %s", e)
     except Exception as e:
-        logger.error(f"Error generating edgeprompt_vs_baseline_constraint.csv: {e}", exc_info=True)
+        logger.error("Error generating edgeprompt_vs_baseline_constraint.csv: %s", e, exc_info=True)
 
     # Token Usage Comparison (Efficiency - Run 4 vs Run 3)
     try:
-        token_df = agg_df[valid_grouping_factors].copy()
-        token_df['avg_tokens_run4'] = agg_df['total_tokens_run4_mean']
-        token_df['avg_tokens_run3'] = agg_df['total_tokens_run3_mean']
-        token_df['token_ratio_run4_vs_run3'] = token_df['avg_tokens_run4'] / token_df['avg_tokens_run3']
-        token_df['token_difference_run4_vs_run3'] = token_df['avg_tokens_run4'] - token_df['avg_tokens_run3']
+        agg_df['avg_tokens_run4'] = agg_df['total_tokens_run4_mean']
+        agg_df['avg_tokens_run3'] = agg_df['total_tokens_run3_mean']
+        agg_df['token_ratio_run4_vs_run3'] = _safe_ratio(agg_df['avg_tokens_run4'], agg_df['avg_tokens_run3'])
+        agg_df['token_difference_run4_vs_run3'] = agg_df['avg_tokens_run4'] - agg_df['avg_tokens_run3']
         
         # Add reference data (Run 1)
-        token_df['avg_tokens_run1'] = agg_df['total_tokens_run1_mean']
-        token_df['token_ratio_run3_vs_run1'] = token_df['avg_tokens_run3'] / token_df['avg_tokens_run1']
-        token_df['token_ratio_run4_vs_run1'] = token_df['avg_tokens_run4'] / token_df['avg_tokens_run1']
+        agg_df['avg_tokens_run1'] = agg_df['total_tokens_run1_mean']
+        agg_df['token_ratio_run3_vs_run1'] = _safe_ratio(agg_df['avg_tokens_run3'], agg_df['avg_tokens_run1'])
+        agg_df['token_ratio_run4_vs_run1'] = _safe_ratio(agg_df['avg_tokens_run4'], agg_df['avg_tokens_run1'])
         
-        token_file = os.path.join(output_dir, 'edgeprompt_vs_baseline_token_usage.csv')
-        token_df.to_csv(token_file, index=False, float_format='%.2f')
-        logger.info(f"Saved token usage comparison results to {token_file}")
+        token_file = _write_comparison_csv(agg_df, valid_grouping_factors, output_dir, 'edgeprompt_vs_baseline_token_usage')
+        logger.info("Saved token usage comparison results to %s", token_file)
     except KeyError as e:
-        logger.warning(f"Could not generate edgeprompt_vs_baseline_token_usage.csv. Missing column: {e}")
+        logger.warning("Could not generate edgeprompt_vs_baseline_token_usage.csv. Missing column: %s", e)
     except Exception as e:
-        logger.error(f"Error generating edgeprompt_vs_baseline_token_usage.csv: {e}", exc_info=True)
+        logger.error("Error generating edgeprompt_vs_baseline_token_usage.csv: %s", e, exc_info=True)
 
     # Latency Comparison (Run 4 vs Run 3)
     try:
-        latency_df = agg_df[valid_grouping_factors].copy()
-        latency_df['avg_latency_run4'] = agg_df['latency_ms_run4_mean']
-        latency_df['avg_latency_run3'] = agg_df['latency_ms_run3_mean']
-        latency_df['latency_ratio_run4_vs_run3'] = latency_df['avg_latency_run4'] / latency_df['avg_latency_run3']
-        latency_df['latency_difference_run4_vs_run3'] = latency_df['avg_latency_run4'] - latency_df['avg_latency_run3']
+        agg_df['avg_latency_run4'] = agg_df['latency_ms_run4_mean']
+        agg_df['avg_latency_run3'] = agg_df['latency_ms_run3_mean']
+        agg_df['latency_ratio_run4_vs_run3'] = _safe_ratio(agg_df['avg_latency_run4'], agg_df['avg_latency_run3'])
+        agg_df['latency_difference_run4_vs_run3'] = agg_df['avg_latency_run4'] - agg_df['avg_latency_run3']
         
         # Add reference data (Run 1)
-        latency_df['avg_latency_run1'] = agg_df['latency_ms_run1_mean']
-        latency_df['latency_ratio_run3_vs_run1'] = latency_df['avg_latency_run3'] / latency_df['avg_latency_run1']
-        latency_df['latency_ratio_run4_vs_run1'] = latency_df['avg_latency_run4'] / latency_df['avg_latency_run1']
+        agg_df['avg_latency_run1'] = agg_df['latency_ms_run1_mean']
+        agg_df['latency_ratio_run3_vs_run1'] = _safe_ratio(agg_df['avg_latency_run3'], agg_df['avg_latency_run1'])
+        agg_df['latency_ratio_run4_vs_run1'] = _safe_ratio(agg_df['avg_latency_run4'], agg_df['avg_latency_run1'])
         
-        latency_file = os.path.join(output_dir, 'edgeprompt_vs_baseline_latency.csv')
-        latency_df.to_csv(latency_file, index=False, float_format='%.2f')
-        logger.info(f"Saved latency comparison results to {latency_file}")
+        latency_file = _write_comparison_csv(agg_df, valid_grouping_factors, output_dir, 'edgeprompt_vs_baseline_latency')
+        logger.info("Saved latency comparison results to %s", latency_file)
     except KeyError as e:
-        logger.warning(f"Could not generate edgeprompt_vs_baseline_latency.csv. Missing column: {e}")
+        logger.warning("Could not generate edgeprompt_vs_baseline_latency.csv. Missing column: %s", e)
     except Exception as e:
-        logger.error(f"Error generating edgeprompt_vs_baseline_latency.csv: {e}", exc_info=True)
+        logger.error("Error generating edgeprompt_vs_baseline_latency.csv: %s", e, exc_info=True)
     
     # Quality Comparison (Placeholder for agreement score)
     # This would be implemented with a proper agreement score calculation
     try:
-        quality_df = agg_df[valid_grouping_factors].copy()
         # Extract outputs for potential quality metrics calculation
         # Currently just placing the output columns for external processing
         
@@ -391,46 +725,32 @@ def analyze_four_run_comparison(df: pd.DataFrame, output_dir: str, logger: loggi
         
         # Calculate average similarity for each group
         # This is just a placeholder - actual implementation would be more sophisticated
-        quality_by_group = {}
-        for idx, group in enumerate(detailed_df.groupby(valid_grouping_factors).groups):
-            group_indices = detailed_df.groupby(valid_grouping_factors).groups[group]
-            run3_vs_run1_scores = []
-            run4_vs_run1_scores = []
-            
-            for i in group_indices:
-                run3_vs_run1 = basic_similarity(output_run3[i], output_run1[i])
-                run4_vs_run1 = basic_similarity(output_run4[i], output_run1[i])
-                run3_vs_run1_scores.append(run3_vs_run1)
-                run4_vs_run1_scores.append(run4_vs_run1)
-            
-            quality_by_group[group] = {
-                'agreement_score_run3_vs_ref': sum(run3_vs_run1_scores) / len(run3_vs_run1_scores) if run3_vs_run1_scores else 0,
-                'agreement_score_run4_vs_ref': sum(run4_vs_run1_scores) / len(run4_vs_run1_scores) if run4_vs_run1_scores else 0
-            }
+        # Scores are written straight into arrays preallocated per group
+        # instead of assembling row dicts for pandas to infer and transpose
+        groups = grouped.groups
+        run3_vs_ref = np.empty(len(groups))
+        run4_vs_ref = np.empty(len(groups))
+        group_keys = []
+        for pos, (group, group_indices) in enumerate(groups.items()):
+            size = len(group_indices)
+            run3_vs_ref[pos] = sum(basic_similarity(output_run3[i], output_run1[i]) for i in group_indices) / size if size else 0
+            run4_vs_ref[pos] = sum(basic_similarity(output_run4[i], output_run1[i]) for i in group_indices) / size if size else 0
+            group_keys.append(group if isinstance(group, tuple) else (group,))
         
         # Create dataframe from quality scores
-        quality_data = []
-        for group, scores in quality_by_group.items():
-            if isinstance(group, tuple):
-                row = dict(zip(valid_grouping_factors, group))
-            else:
-                row = {valid_grouping_factors[0]: group}
-            row.update(scores)
-            row['agreement_diff_run4_vs_run3'] = row['agreement_score_run4_vs_ref'] - row['agreement_score_run3_vs_ref']
-            quality_data.append(row)
-        
-        quality_df = pd.DataFrame(quality_data)
+        quality_df = pd.DataFrame(group_keys, columns=valid_grouping_factors)
+        quality_df['agreement_score_run3_vs_ref'] = run3_vs_ref
+        quality_df['agreement_score_run4_vs_ref'] = run4_vs_ref
+        quality_df['agreement_diff_run4_vs_run3'] = run4_vs_ref - run3_vs_ref
         
-        quality_file = os.path.join(output_dir, 'quality_vs_reference.csv')
-        quality_df.to_csv(quality_file, index=False, float_format='%.4f')
-        logger.info(f"Saved quality comparison results to {quality_file}")
+        quality_file = write_table(quality_df, output_dir, 'quality_vs_reference', logger, float_format='%.4f')
+        logger.info("Saved quality comparison results to %s", quality_file)
     except Exception as e:
-        logger.error(f"Error generating quality_vs_reference.csv: {e}", exc_info=True)
+        logger.error("Error generating quality_vs_reference.csv: %s", e, exc_info=True)
     
     # Save aggregated results (all metrics) 
-    aggregated_file = os.path.join(output_dir, 'four_run_comparison_aggregated.csv')
-    agg_df.to_csv(aggregated_file, index=False)
-    logger.info(f"Saved aggregated four-run comparison results to {aggregated_file}")
+    aggregated_file = write_table(agg_df, output_dir, 'four_run_comparison_aggregated', logger)
+    logger.info("Saved aggregated four-run comparison results to %s", aggregated_file)
 
 # Placeholder for other analysis functions (Phase 2 or specific tests)
 def analyze_multi_stage_validation(df: pd.DataFrame, output_dir: str, logger: logging.Logger) -> None:
@@ -486,22 +806,22 @@ def main():
     # Set up logging
     logger = setup_logging(args.log_level)
     
-    # Load results
-    df = load_results(args.data_dir, logger)
+    # Load results, partitioned so each analyzer only sees the suites it reads
+    partitions = load_results_by_suite(args.data_dir, logger)
     
-    if df.empty:
+    if not partitions:
         logger.error("No results data loaded. Exiting analysis.")
         sys.exit(1)
     
     # Perform requested analysis
     if args.analysis_type == 'all' or args.analysis_type == 'four_run_comparison':
-        analyze_four_run_comparison(df, args.output_dir, logger)
+        analyze_four_run_comparison(select_suites(partitions, 'four_run_comparison'), args.output_dir, logger)
         
     if args.analysis_type == 'all' or args.analysis_type == 'multi_stage':
-        analyze_multi_stage_validation(df, args.output_dir, logger)
+        analyze_multi_stage_validation(select_suites(partitions, 'multi_stage'), args.output_dir, logger)
         
     if args.analysis_type == 'all' or args.analysis_type == 'resource':
-        analyze_resource_optimization(df, args.output_dir, logger)
+        analyze_resource_optimization(select_suites(partitions, 'resource'), args.output_dir, logger)
 
     logger.info("Analysis finished.")
 
@@ -10,18 +10,60 @@ This script organizes the data directory by:
 """
 
 import os
+import re
 import sys
 import json
 import shutil
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Set, Tuple
-import glob
+from operator import itemgetter
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
 
 # Add parent directory to path to enable imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
+# Metric columns consolidated per model (JSONL records also get has_error)
+METRIC_COLUMNS = (
+    'test_case_id', 'hardware_profile', 'execution_time_ms', 'memory_usage_mb',
+    'is_valid', 'validation_score', 'timestamp', 'source'
+)
+
+# Common temporary files to remove (*.tmp, *.temp, *~, *.bak, .DS_Store,
+# Thumbs.db) as one pattern, so each file name is matched once. As with glob,
+# the wildcards never match hidden (dot-prefixed) names.
+TEMP_FILE_RE = re.compile(r'(?!\.).*(?:\.tmp|\.temp|~|\.bak)|\.DS_Store|Thumbs\.db', re.DOTALL)
+
+# Per-suite record of the sources and outputs of the last consolidation
+METRICS_MANIFEST_SUFFIX = '_metrics_manifest.json'
+
+# Low-cardinality metric columns stored as categoricals in Parquet output
+CATEGORICAL_METRIC_COLUMNS = ('hardware_profile', 'source')
+
+# Shared read-only default for missing nested result dicts (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Worker threads for I/O-bound per-file operations
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Configure logging for the script"""
     log_level_map = {
@@ -42,6 +84,57 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     logger = logging.getLogger('edgeprompt.cleanup')
     return logger
 
+def scan_suite(suite_dir: str) -> Dict[str, Any]:
+    """
+    Classify the result files of one test suite directory in a single scandir pass.
+    
+    Args:
+        suite_dir: Test suite directory
+        
+    Returns:
+        Dictionary mapping file types ('jsonl', 'summary', 'individual') to paths,
+        plus 'mtimes' mapping each summary and JSONL path to its modification time
+        and 'names' mapping every path to its file name
+    """
+    files = {'jsonl': [], 'summary': [], 'individual': [], 'mtimes': {}, 'names': {}}
+    with os.scandir(suite_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            # d_type answers is_file without a stat; symlinks are not followed
+            if name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                continue
+            files['names'][entry.path] = name
+            if name.endswith('.jsonl'):
+                files['jsonl'].append(entry.path)
+                files['mtimes'][entry.path] = entry.stat().st_mtime
+            elif name.startswith('results_') and name.endswith('.json'):
+                files['summary'].append(entry.path)
+                # Stat once here; summaries are sorted by mtime later
+                files['mtimes'][entry.path] = entry.stat().st_mtime
+            elif name.endswith('.json'):
+                files['individual'].append(entry.path)
+    return files
+
+def _mtime(files: Dict[str, Any], path: str) -> float:
+    """Modification time of a suite file, from the scan_suite cache when present."""
+    mtimes = files.get('mtimes', {})
+    return mtimes[path] if path in mtimes else os.path.getmtime(path)
+
+def _name(files: Dict[str, Any], path: str) -> str:
+    """File name of a suite file, from the scan_suite cache when present."""
+    names = files.get('names', {})
+    return names[path] if path in names else os.path.basename(path)
+
+def newest_summaries(files: Dict[str, Any]) -> List[str]:
+    """
+    Return a suite's summary files sorted by modification time, newest first.
+    
+    Uses the mtimes cached by scan_suite, statting only paths it did not see.
+    """
+    pairs = [(path, _mtime(files, path)) for path in files['summary']]
+    pairs.sort(key=itemgetter(1), reverse=True)
+    return [path for path, _ in pairs]
+
 def collect_test_suites(data_dir: str, logger: logging.Logger) -> Dict[str, Dict[str, List[str]]]:
     """
     Collect all test suites and their result files, categorizing them by type.
@@ -60,26 +153,40 @@ def collect_test_suites(data_dir: str, logger: logging.Logger) -> Dict[str, Dict
         
     # Get all subdirectories in raw (each is a test suite)
     test_suites = {}
-    for item in os.listdir(raw_dir):
-        suite_dir = os.path.join(raw_dir, item)
-        if os.path.isdir(suite_dir):
-            # Find all result files by type
-            json_files = glob.glob(os.path.join(suite_dir, '*.json'))
-            jsonl_files = glob.glob(os.path.join(suite_dir, '*.jsonl'))
-            summary_files = [f for f in json_files if os.path.basename(f).startswith('results_')]
-            individual_json_files = [f for f in json_files if not os.path.basename(f).startswith('results_')]
-            
-            test_suites[item] = {
-                'jsonl': jsonl_files,
-                'summary': summary_files,
-                'individual': individual_json_files
-            }
-            
-            logger.info(f"Found test suite '{item}' with {len(jsonl_files)} JSONL files, "
-                       f"{len(summary_files)} summary files, and {len(individual_json_files)} individual result files")
+    with os.scandir(raw_dir) as entries:
+        suite_entries = [entry for entry in entries if entry.is_dir(follow_symlinks=False)]
+    for entry in suite_entries:
+        item = entry.name
+        # Find all result files by type in one pass over the suite directory
+        files = scan_suite(entry.path)
+        test_suites[item] = files
+        
+        logger.info(f"Found test suite '{item}' with {len(files['jsonl'])} JSONL files, "
+                   f"{len(files['summary'])} summary files, and {len(files['individual'])} individual result files")
             
     return test_suites
 
+def _copy_file(paths: Tuple[str, str]) -> Optional[Exception]:
+    """Copy one file with metadata; runs in a worker thread, so errors are returned, not logged."""
+    try:
+        shutil.copy2(*paths)
+    except Exception as e:
+        return e
+    return None
+
+def copy_files(copies: List[Tuple[str, str]]) -> Iterator[Tuple[Tuple[str, str], Optional[Exception]]]:
+    """
+    Copy a batch of (source, destination) pairs across a thread pool.
+    
+    Small-file copies are dominated by open/read/write latency, which
+    overlaps across threads since the GIL is released during I/O.
+    
+    Yields:
+        ((source, destination), error) in input order; error is None on success
+    """
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        yield from zip(copies, executor.map(_copy_file, copies))
+
 def backup_all_data(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str, logger: logging.Logger) -> None:
     """
     Create backups of all data files before processing.
@@ -95,7 +202,8 @@ def backup_all_data(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str,
     os.makedirs(backup_dir, exist_ok=True)
     logger.info(f"Created backup directory: {backup_dir}")
     
-    # Backup each test suite
+    # Collect the copies for each test suite
+    copies = []
     for suite_name, files in test_suites.items():
         suite_backup = os.path.join(backup_dir, suite_name)
         os.makedirs(suite_backup, exist_ok=True)
@@ -103,16 +211,40 @@ def backup_all_data(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str,
         # Backup all files
         all_files = files['jsonl'] + files['summary'] + files['individual']
         for file_path in all_files:
-            dest_file = os.path.join(suite_backup, os.path.basename(file_path))
-            try:
-                shutil.copy2(file_path, dest_file)
-                logger.debug(f"Backed up: {file_path} -> {dest_file}")
-            except Exception as e:
-                logger.error(f"Error backing up {file_path}: {str(e)}")
+            copies.append((file_path, os.path.join(suite_backup, _name(files, file_path))))
+    
+    for (file_path, dest_file), error in copy_files(copies):
+        if error is None:
+            logger.debug(f"Backed up: {file_path} -> {dest_file}")
+        else:
+            logger.error(f"Error backing up {file_path}: {str(error)}")
     
     logger.info(f"All data backed up to: {backup_dir}")
     return backup_dir
 
+def _loads(data: bytes) -> Any:
+    """Decode JSON with orjson when available, falling back to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump can emit
+            pass
+    return json.loads(data)
+
+def iter_summary_results(summary_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the raw_results entries of a summary file.
+    
+    With ijson installed the entries are streamed one at a time instead of
+    decoding the whole summary into memory first.
+    """
+    with open(summary_file, 'rb') as f:
+        if ijson is not None:
+            yield from ijson.items(f, 'raw_results.item', use_float=True)
+        else:
+            yield from _loads(f.read()).get('raw_results', [])
+
 def extract_jsonl_data(jsonl_files: List[str], logger: logging.Logger) -> List[Dict[str, Any]]:
     """
     Extract data from JSONL files with simple deterministic logic.
@@ -130,14 +262,14 @@ def extract_jsonl_data(jsonl_files: List[str], logger: logging.Logger) -> List[D
     for file_path in jsonl_files:
         record_count = 0
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb') as f:
                 for line in f:
                     try:
-                        record = json.loads(line.strip())
+                        record = _loads(line.strip())
                         record['_source_file'] = file_path  # Add source tracking
                         all_records.append(record)
                         record_count += 1
-                    except json.JSONDecodeError as e:
+                    except ValueError as e:
                         logger.warning(f"Skipping invalid JSON line in {file_path}: {e}")
                         continue
             
@@ -163,7 +295,9 @@ def archive_old_runs(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str
         os.makedirs(archive_dir)
         logger.info(f"Created archive directory: {archive_dir}")
     
-    # Process each test suite
+    # Plan the copies for each test suite, then copy them in one batch
+    copies = []
+    filenames = []
     for suite_name, files in test_suites.items():
         logger.info(f"Archiving old runs for test suite: {suite_name}")
         
@@ -174,30 +308,31 @@ def archive_old_runs(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str
         # Archive summary files except the most recent one (by timestamp)
         if len(files['summary']) > 1:
             # Sort by modification time (newest first)
-            sorted_summaries = sorted(files['summary'], key=os.path.getmtime, reverse=True)
+            sorted_summaries = newest_summaries(files)
             
             # Keep the most recent, archive the rest
             most_recent = sorted_summaries[0]
             to_archive = sorted_summaries[1:]
             
-            logger.info(f"Keeping most recent summary: {os.path.basename(most_recent)}")
+            logger.info(f"Keeping most recent summary: {_name(files, most_recent)}")
             
             # Archive older summaries
             for file_path in to_archive:
-                filename = os.path.basename(file_path)
+                filename = _name(files, file_path)
                 timestamp = filename.replace('results_', '').replace('.json', '')
                 
                 # Create timestamp directory
                 timestamp_dir = os.path.join(suite_archive, timestamp)
                 os.makedirs(timestamp_dir, exist_ok=True)
-                
-                # Copy to archive
-                dest_file = os.path.join(timestamp_dir, filename)
-                try:
-                    shutil.copy2(file_path, dest_file)
-                    logger.info(f"Archived summary: {filename}")
-                except Exception as e:
-                    logger.error(f"Error archiving {file_path}: {str(e)}")
+                copies.append((file_path, os.path.join(timestamp_dir, filename)))
+                filenames.append(filename)
+    
+    # Copy to archive
+    for filename, ((file_path, dest_file), error) in zip(filenames, copy_files(copies)):
+        if error is None:
+            logger.info(f"Archived summary: {filename}")
+        else:
+            logger.error(f"Error archiving {file_path}: {str(error)}")
 
 def remove_temp_files(data_dir: str, logger: logging.Logger) -> None:
     """
@@ -207,121 +342,214 @@ def remove_temp_files(data_dir: str, logger: logging.Logger) -> None:
         data_dir: Base data directory
         logger: Logger instance
     """
-    # Common temporary files to remove
-    temp_patterns = [
-        '*.tmp',
-        '*.temp',
-        '*~',
-        '*.bak',
-        '.DS_Store',
-        'Thumbs.db'
-    ]
-    
-    # Find and remove temporary files
-    for pattern in temp_patterns:
-        temp_files = glob.glob(os.path.join(data_dir, '**', pattern), recursive=True)
-        for file_path in temp_files:
+    # Find and remove temporary files in a single walk of the data directory.
+    # Where supported, fwalk keeps each directory open so files are unlinked
+    # relative to its descriptor (unlinkat) instead of resolving full paths.
+    if hasattr(os, 'fwalk') and os.unlink in os.supports_dir_fd:
+        walk = ((root, dirnames, filenames, dir_fd) for root, dirnames, filenames, dir_fd in os.fwalk(data_dir))
+    else:
+        walk = ((root, dirnames, filenames, None) for root, dirnames, filenames in os.walk(data_dir))
+    
+    is_temp_file = TEMP_FILE_RE.fullmatch
+    for root, dirnames, filenames, dir_fd in walk:
+        # Like a recursive glob, never descend into hidden directories
+        dirnames[:] = [dirname for dirname in dirnames if not dirname.startswith('.')]
+        for filename in filenames:
+            if not is_temp_file(filename):
+                continue
+            file_path = os.path.join(root, filename)
             try:
-                os.remove(file_path)
+                if dir_fd is None:
+                    os.remove(file_path)
+                else:
+                    os.unlink(filename, dir_fd=dir_fd)
                 logger.info(f"Removed temporary file: {file_path}")
             except Exception as e:
                 logger.error(f"Error removing {file_path}: {str(e)}")
 
-def consolidate_results(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str, logger: logging.Logger) -> None:
+def group_metrics_by_model(records: Iterable[Dict[str, Any]], source: str) -> Dict[str, Dict[str, List[Any]]]:
+    """
+    Extract the basic metrics of each result record, grouped by model, in one pass.
+    
+    Metrics are accumulated column-wise per model, so they can be handed to
+    pandas without building a dictionary per record.
+    
+    Args:
+        records: Result records (JSONL records or summary raw_results)
+        source: 'jsonl' or 'summary'; JSONL metrics also record has_error
+        
+    Returns:
+        Dictionary mapping model IDs to dictionaries of metric columns
+    """
+    columns = list(METRIC_COLUMNS)
+    if source == 'jsonl':
+        columns.insert(columns.index('timestamp'), 'has_error')
+    results_by_model = {}
+    for record in records:
+        model_id = record.get('model_id', 'unknown')
+        model_columns = results_by_model.get(model_id)
+        if model_columns is None:
+            model_columns = results_by_model[model_id] = {column: [] for column in columns}
+        
+        # Look up each nested dict once; missing or null ones read as empty
+        metrics = record.get('metrics') or _EMPTY
+        validation = record.get('validation_result') or _EMPTY
+        model_columns['test_case_id'].append(record.get('test_case_id', 'unknown'))
+        model_columns['hardware_profile'].append(record.get('hardware_profile', 'unknown'))
+        model_columns['execution_time_ms'].append(metrics.get('execution_time_ms', 0))
+        model_columns['memory_usage_mb'].append(metrics.get('memory_usage_mb', 0))
+        model_columns['is_valid'].append(validation.get('isValid', False))
+        model_columns['validation_score'].append(validation.get('score', 0))
+        if 'has_error' in model_columns:
+            model_columns['has_error'].append('error' in record)
+        model_columns['timestamp'].append(record.get('timestamp', ''))
+        model_columns['source'].append(source)
+    return results_by_model
+
+def _narrow_metric_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store repeated identifiers as categoricals and float metrics as float32."""
+    for column in CATEGORICAL_METRIC_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype('category')
+    for column in df.select_dtypes('float64').columns:
+        df[column] = df[column].astype('float32')
+    return df
+
+def save_metrics_by_model(results_by_model: Dict[str, Dict[str, List[Any]]], suite_name: str,
+                          processed_dir: str, logger: logging.Logger, legacy_json: bool = False) -> List[str]:
+    """
+    Save each model's metrics to {suite}_{model}_metrics.parquet in the processed directory.
+    
+    Parquet (zstd) is written when pyarrow is available; with legacy_json, or
+    without pyarrow, the metrics are written as {suite}_{model}_metrics.json.
+    
+    Args:
+        results_by_model: Output of group_metrics_by_model
+        suite_name: Test suite name
+        processed_dir: Processed data directory
+        logger: Logger instance
+        legacy_json: Write indented JSON lists of records instead of Parquet
+        
+    Returns:
+        File names of the metrics files that were written
+    """
+    written = []
+    for model_id, columns in results_by_model.items():
+        count = len(columns['test_case_id'])
+        if legacy_json or pyarrow is None:
+            output_file = os.path.join(processed_dir, f'{suite_name}_{model_id}_metrics.json')
+            names = list(columns)
+            # Legacy output keeps the stdlib encoder so it matches earlier json.dump files
+            with open(output_file, 'w') as f:
+                json.dump([dict(zip(names, row)) for row in zip(*columns.values())], f, indent=2)
+        else:
+            output_file = os.path.join(processed_dir, f'{suite_name}_{model_id}_metrics.parquet')
+            try:
+                _narrow_metric_dtypes(pd.DataFrame(columns)).to_parquet(
+                    output_file, engine='pyarrow', compression='zstd', index=False)
+            except (ValueError, TypeError, pyarrow.ArrowException) as e:
+                logger.error(f"Error writing {output_file}: {str(e)}")
+                continue
+        written.append(os.path.basename(output_file))
+        logger.info(f"Saved {count} metrics for {model_id} to: {output_file}")
+    return written
+
+def metrics_up_to_date(manifest_file: str, files: Dict[str, Any], sources: List[str],
+                       output_mtimes: Dict[str, float]) -> bool:
+    """
+    Check from the suite's manifest and cached mtimes alone whether its metrics are current.
+    
+    The sources are not opened: the suite is up to date when the manifest lists
+    the same source files and every metrics file it lists still exists and is
+    at least as new as the newest source.
+    
+    Args:
+        manifest_file: Path of the suite's metrics manifest
+        files: Suite files from scan_suite
+        sources: Paths of the files the suite would be consolidated from
+        output_mtimes: Modification times of the existing metrics files, by file name
+        
+    Returns:
+        True if no metrics file would change, False if any is missing or stale
+    """
+    try:
+        with open(manifest_file, 'rb') as f:
+            manifest = _loads(f.read())
+    except (OSError, ValueError):
+        return False
+    if not isinstance(manifest, dict) or manifest.get('sources') != sorted(_name(files, path) for path in sources):
+        return False
+    mtimes = [output_mtimes.get(name) for name in manifest.get('outputs') or ()]
+    return bool(mtimes) and None not in mtimes and min(mtimes) >= max(_mtime(files, path) for path in sources)
+
+def write_metrics_manifest(manifest_file: str, files: Dict[str, Any], sources: List[str], outputs: List[str]) -> None:
+    """Record which source files a suite's metrics files were consolidated from."""
+    with open(manifest_file, 'w') as f:
+        json.dump({'sources': sorted(_name(files, path) for path in sources), 'outputs': sorted(outputs)}, f, indent=2)
+
+def consolidate_results(test_suites: Dict[str, Dict[str, List[str]]], data_dir: str, logger: logging.Logger,
+                        legacy_json: bool = False, force: bool = False) -> None:
     """
     Consolidate results into processed metrics files, using a deterministic approach.
     
+    Suites whose manifest shows their metrics files are newer than the files
+    they were consolidated from are skipped without parsing those files,
+    unless force is set.
+    
     Args:
         test_suites: Dictionary mapping test suite names to dictionaries of file types and paths
         data_dir: Base data directory
         logger: Logger instance
+        legacy_json: Write per-model metrics as JSON instead of Parquet
+        force: Re-consolidate suites even if their metrics files are up to date
     """
     processed_dir = os.path.join(data_dir, 'processed')
     
     # Ensure processed directory exists
     os.makedirs(processed_dir, exist_ok=True)
     
+    # Modification times of the existing metrics files, in one directory scan
+    metrics_suffix = '_metrics.json' if legacy_json or pyarrow is None else '_metrics.parquet'
+    with os.scandir(processed_dir) as entries:
+        output_mtimes = {entry.name: entry.stat().st_mtime for entry in entries if entry.name.endswith(metrics_suffix)}
+    
     # Process each test suite
     for suite_name, files in test_suites.items():
         logger.info(f"Consolidating results for test suite: {suite_name}")
         
+        manifest_file = os.path.join(processed_dir, f'{suite_name}{METRICS_MANIFEST_SUFFIX}')
+        
         # Process JSONL files (primary source of truth)
         if files['jsonl']:
+            if not force and metrics_up_to_date(manifest_file, files, files['jsonl'], output_mtimes):
+                logger.info(f"Skipping unchanged test suite: {suite_name} (metrics are up to date)")
+                continue
+            
             # Extract all records from JSONL files
             all_records = extract_jsonl_data(files['jsonl'], logger)
             
             if all_records:
                 # Group by model for consolidated metrics
-                results_by_model = {}
-                
-                for record in all_records:
-                    model_id = record.get('model_id', 'unknown')
-                    
-                    if model_id not in results_by_model:
-                        results_by_model[model_id] = []
-                    
-                    # Extract basic metrics
-                    test_case_id = record.get('test_case_id', 'unknown') 
-                    metrics = {
-                        'test_case_id': test_case_id,
-                        'hardware_profile': record.get('hardware_profile', 'unknown'),
-                        'execution_time_ms': record.get('metrics', {}).get('execution_time_ms', 0),
-                        'memory_usage_mb': record.get('metrics', {}).get('memory_usage_mb', 0),
-                        'is_valid': record.get('validation_result', {}).get('isValid', False),
-                        'validation_score': record.get('validation_result', {}).get('score', 0),
-                        'has_error': 'error' in record,
-                        'timestamp': record.get('timestamp', ''),
-                        'source': 'jsonl'
-                    }
-                    
-                    results_by_model[model_id].append(metrics)
-                
-                # Save metrics by model
-                for model_id, metrics in results_by_model.items():
-                    output_file = os.path.join(processed_dir, f'{suite_name}_{model_id}_metrics.json')
-                    with open(output_file, 'w') as f:
-                        json.dump(metrics, f, indent=2)
-                    logger.info(f"Saved {len(metrics)} metrics for {model_id} to: {output_file}")
+                results_by_model = group_metrics_by_model(all_records, 'jsonl')
+                written = save_metrics_by_model(results_by_model, suite_name, processed_dir, logger, legacy_json)
+                if len(written) == len(results_by_model):
+                    write_metrics_manifest(manifest_file, files, files['jsonl'], written)
         
         # If no JSONL, try using summary file as fallback
         elif files['summary'] and not files['jsonl']:
             # Take the most recent summary
-            latest_summary = sorted(files['summary'], key=os.path.getmtime, reverse=True)[0]
-            logger.info(f"No JSONL files for {suite_name}, using summary: {os.path.basename(latest_summary)}")
+            latest_summary = newest_summaries(files)[0]
+            logger.info(f"No JSONL files for {suite_name}, using summary: {_name(files, latest_summary)}")
+            if not force and metrics_up_to_date(manifest_file, files, [latest_summary], output_mtimes):
+                logger.info(f"Skipping unchanged test suite: {suite_name} (metrics are up to date)")
+                continue
             
             try:
-                with open(latest_summary, 'r') as f:
-                    summary_data = json.load(f)
-                
                 # Extract and group by model
-                results_by_model = {}
-                
-                for result in summary_data.get('raw_results', []):
-                    model_id = result.get('model_id', 'unknown')
-                    
-                    if model_id not in results_by_model:
-                        results_by_model[model_id] = []
-                    
-                    # Extract basic metrics
-                    metrics = {
-                        'test_case_id': result.get('test_case_id', 'unknown'),
-                        'hardware_profile': result.get('hardware_profile', 'unknown'),
-                        'execution_time_ms': result.get('metrics', {}).get('execution_time_ms', 0),
-                        'memory_usage_mb': result.get('metrics', {}).get('memory_usage_mb', 0),
-                        'is_valid': result.get('validation_result', {}).get('isValid', False),
-                        'validation_score': result.get('validation_result', {}).get('score', 0),
-                        'timestamp': result.get('timestamp', ''),
-                        'source': 'summary'
-                    }
-                    
-                    results_by_model[model_id].append(metrics)
-                
-                # Save metrics by model
-                for model_id, metrics in results_by_model.items():
-                    output_file = os.path.join(processed_dir, f'{suite_name}_{model_id}_metrics.json')
-                    with open(output_file, 'w') as f:
-                        json.dump(metrics, f, indent=2)
-                    logger.info(f"Saved {len(metrics)} metrics for {model_id} to: {output_file}")
+                results_by_model = group_metrics_by_model(iter_summary_results(latest_summary), 'summary')
+                written = save_metrics_by_model(results_by_model, suite_name, processed_dir, logger, legacy_json)
+                if len(written) == len(results_by_model):
+                    write_metrics_manifest(manifest_file, files, [latest_summary], written)
             
             except Exception as e:
                 logger.error(f"Error processing summary file {latest_summary}: {str(e)}")
@@ -355,6 +583,18 @@ def parse_args():
         help='Skip archiving old runs'
     )
     
+    parser.add_argument(
+        '--legacy-json',
+        action='store_true',
+        help='Write consolidated metrics as JSON instead of Parquet'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Re-consolidate all test suites, even those whose metrics are up to date'
+    )
+    
     parser.add_argument(
         '--skip-backup',
         action='store_true',
@@ -396,7 +636,7 @@ def main():
     
     # Consolidate results
     logger.info("Consolidating results...")
-    consolidate_results(test_suites, args.data_dir, logger)
+    consolidate_results(test_suites, args.data_dir, logger, args.legacy_json, args.force)
     
     logger.info("Data cleanup completed successfully")
     
@@ -7,36 +7,37 @@ suitable for inclusion in the EdgePrompt paper.
 """
 
 import argparse
+import csv
+import io
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-# Third-party imports
-import matplotlib
-import matplotlib.pyplot as plt
+# Third-party imports (matplotlib and seaborn are loaded by load_plotting)
 import numpy as np
 import pandas as pd
-import seaborn as sns
 
-# Use non-interactive backend (doesn't require display)
-matplotlib.use('Agg')
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
 
 # Add parent directory to path to enable imports (if utils are needed later)
 # sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-# Set up publication-quality figure settings
-plt.rcParams['figure.figsize'] = (10, 6)
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.size'] = 12
-plt.rcParams['axes.titlesize'] = 14
-plt.rcParams['axes.labelsize'] = 12
-plt.rcParams['xtick.labelsize'] = 10
-plt.rcParams['ytick.labelsize'] = 10
-plt.rcParams['legend.fontsize'] = 10
-plt.rcParams['figure.titlesize'] = 16
+# Resolution of figures saved for publication (--hi-dpi)
+PUBLICATION_DPI = 300
+
+# Fast zlib level for PNG output; bar charts compress well at any level
+PNG_SAVE_KWARGS = {'pil_kwargs': {'compress_level': 1}}
 
 def setup_logging(log_level: str = "INFO") -> logging.Logger:
     """Configure logging for the figure generator"""
@@ -58,315 +59,385 @@ def setup_logging(log_level: str = "INFO") -> logging.Logger:
     logger = logging.getLogger('edgeprompt.figures')
     return logger
 
-def render_edgeprompt_vs_baseline_safety(data_dir: str, output_dir: str, logger: logging.Logger) -> None:
+# Comparison tables analyze_results.py writes only as CSV projections; their
+# columns are all carried by the aggregated four-run table's Parquet copy
+AGGREGATED_TABLE = 'four_run_comparison_aggregated'
+COMPARISON_TABLES = frozenset({
+    'edgeprompt_vs_baseline_safety', 'edgeprompt_vs_baseline_constraint',
+    'edgeprompt_vs_baseline_token_usage', 'edgeprompt_vs_baseline_latency'
+})
+
+# Column dtypes of the processed CSV tables, so read_csv skips type inference.
+# Identifier columns load as categoricals, matching the Parquet copies. Metrics
+# only plotted load as float32; those printed in paper tables stay float64 so
+# their rounded values are written without float32 representation noise.
+ID_DTYPES = {
+    'cloud_llm_model_id': 'category',
+    'edge_llm_model_id': 'category',
+    'hardware_profile': 'category',
+}
+TABLE_DTYPES = {
+    name: {**ID_DTYPES, **{col: value_dtype for col in value_columns}}
+    for name, (value_dtype, value_columns) in {
+        'edgeprompt_vs_baseline_safety': ('float32', (
+            'safety_violation_rate_run4', 'safety_violation_rate_run3', 'safety_rate_difference_run4_vs_run3'
+        )),
+        'edgeprompt_vs_baseline_constraint': ('float32', (
+            'constraint_pass_rate_run4', 'constraint_pass_rate_run3', 'constraint_rate_difference_run4_vs_run3'
+        )),
+        'edgeprompt_vs_baseline_token_usage': ('float64', (
+            'avg_tokens_run4', 'avg_tokens_run3', 'token_ratio_run4_vs_run3', 'token_difference_run4_vs_run3',
+            'avg_tokens_run1', 'token_ratio_run3_vs_run1', 'token_ratio_run4_vs_run1'
+        )),
+        'edgeprompt_vs_baseline_latency': ('float64', (
+            'avg_latency_run4', 'avg_latency_run3', 'latency_ratio_run4_vs_run3', 'latency_difference_run4_vs_run3',
+            'avg_latency_run1', 'latency_ratio_run3_vs_run1', 'latency_ratio_run4_vs_run1'
+        )),
+        'quality_vs_reference': ('float32', (
+            'agreement_score_run3_vs_ref', 'agreement_score_run4_vs_ref', 'agreement_diff_run4_vs_run3'
+        )),
+    }.items()
+}
+
+def processed_table_path(data_dir: str, name: str) -> str:
     """
-    Render Figure: Safety Effectiveness Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline).
-    
-    Args:
-        data_dir: Directory containing processed data
-        output_dir: Directory to save figures
-        logger: Logger instance
-    """
-    input_file = os.path.join(data_dir, 'edgeprompt_vs_baseline_safety.csv')
-    
-    if not os.path.exists(input_file):
-        logger.warning(f"Safety comparison data not found: {input_file}. Skipping figure generation.")
-        return
-        
-    try:
-        df = pd.read_csv(input_file)
-        if df.empty:
-            logger.warning(f"No safety comparison data available in {input_file}. Skipping figure.")
-            return
-    except Exception as e:
-         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
-         return
-        
-    logger.info("Rendering Figure: Safety Effectiveness Comparison (EdgePrompt vs. Edge Baseline)...")
-    
-    # Check required columns
-    id_vars = [col for col in ["hardware_profile", "edge_llm_model_id"] if col in df.columns]
-    value_vars = [col for col in ["safety_violation_rate_run4", "safety_violation_rate_run3"] if col in df.columns]
-    if not id_vars or len(value_vars) != 2:
-        logger.error(f"Missing required columns in {input_file} for safety comparison plot. Need grouping ({id_vars}) and value ({value_vars}) columns.")
-        return
+    Resolve a processed table written by analyze_results.py.
 
-    # Set up the figure
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # Reshape data for grouped bar chart
-    try:
-        melted_df = pd.melt(
-            df, 
-            id_vars=id_vars,
-            value_vars=value_vars,
-            var_name="scenario", 
-            value_name="violation_rate"
-        )
-    except Exception as e:
-         logger.error(f"Error melting dataframe for plotting: {e}", exc_info=True)
-         plt.close(fig)
-         return
-
-    # Replace scenario names for better labels
-    melted_df["scenario"] = melted_df["scenario"].replace({
-        "safety_violation_rate_run4": "EdgePrompt (Run 4)",
-        "safety_violation_rate_run3": "Edge Baseline (Run 3)"
-    })
-    
-    # Determine grouping variable for x-axis
-    x_group = "edge_llm_model_id" if "edge_llm_model_id" in id_vars else id_vars[0]
-    
-    # Create grouped bar chart
-    try:
-        sns.barplot(
-            x=x_group, 
-            y="violation_rate",
-            hue="scenario", 
-            data=melted_df,
-            ax=ax,
-            palette="viridis" # Use a visually distinct palette
-        )
-    except Exception as e:
-         logger.error(f"Error creating barplot: {e}", exc_info=True)
-         plt.close(fig)
-         return
-    
-    # Add labels and title
-    ax.set_xlabel("EdgeLLM Model")
-    ax.set_ylabel("Safety Violation Rate (%)")
-    ax.set_title("Safety Effectiveness: EdgeLLM EdgePrompt vs. EdgeLLM Baseline")
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.0f}%')) # Format y-axis as percentage
-    
-    # Add value labels on bars
-    try:
-        for container in ax.containers:
-            ax.bar_label(container, fmt='%.1f%%', padding=3)
-    except Exception as e:
-         logger.warning(f"Could not add bar labels: {e}") # Non-critical error
-    
-    # Add gridlines
-    ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-    ax.legend(title='Method')
-    plt.xticks(rotation=45, ha="right") # Rotate labels if they overlap
-    
-    # Adjust layout and save
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'Figure_Paper_EdgePrompt_vs_Baseline_Safety.png')
-    try:
-        plt.savefig(output_file)
-        logger.info(f"Saved safety comparison figure to {output_file}")
-    except Exception as e:
-         logger.error(f"Failed to save figure {output_file}: {e}")
-    finally:
-        plt.close(fig) # Ensure figure is closed
+    Prefers the Parquet copy (the aggregated table for comparison tables) when
+    pyarrow is installed and it is at least as new as the CSV, so a stale
+    Parquet file left by an analysis run without pyarrow is never read.
+    """
+    csv_file = os.path.join(data_dir, f'{name}.csv')
+    if pyarrow is not None:
+        parquet_name = AGGREGATED_TABLE if name in COMPARISON_TABLES else name
+        parquet_file = os.path.join(data_dir, f'{parquet_name}.parquet')
+        try:
+            parquet_mtime = os.path.getmtime(parquet_file)
+        except OSError:
+            return csv_file
+        try:
+            if parquet_mtime < os.path.getmtime(csv_file):
+                return csv_file
+        except OSError:
+            pass
+        return parquet_file
+    return csv_file
+
+def read_processed_table(input_file: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Load a processed table resolved by processed_table_path.
 
-def render_edgeprompt_vs_baseline_constraint(data_dir: str, output_dir: str, logger: logging.Logger) -> None:
+    Only the given columns are parsed, if any; columns missing from the table
+    are ignored, leaving callers to report them. Tables are cached until the
+    file changes, so callers must not modify the returned frame in place.
     """
-    Render Figure: Constraint Adherence Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline).
-    
-    Args:
-        data_dir: Directory containing processed data
-        output_dir: Directory to save figures
-        logger: Logger instance
+    return _load_processed_table(input_file, os.path.getmtime(input_file),
+                                 None if columns is None else tuple(columns))
+
+@lru_cache(maxsize=32)
+def _load_processed_table(input_file: str, mtime: float, columns: Optional[Tuple[str, ...]]) -> pd.DataFrame:
+    """Parse a processed table; mtime is part of the cache key only."""
+    if input_file.endswith('.parquet'):
+        if columns is not None:
+            available = set(pyarrow.parquet.read_schema(input_file).names)
+            columns = [col for col in columns if col in available]
+        return pd.read_parquet(input_file, engine='pyarrow', columns=columns)
+    name = os.path.splitext(os.path.basename(input_file))[0]
+    usecols = None if columns is None else set(columns).__contains__
+    return pd.read_csv(input_file, dtype=TABLE_DTYPES.get(name), usecols=usecols, engine='c')
+
+def write_table_csv(table_df: pd.DataFrame, output_file: str) -> None:
     """
-    input_file = os.path.join(data_dir, 'edgeprompt_vs_baseline_constraint.csv')
-    
-    if not os.path.exists(input_file):
-        logger.warning(f"Constraint comparison data not found: {input_file}. Skipping figure generation.")
-        return
-        
-    try:
-        df = pd.read_csv(input_file)
-        if df.empty:
-            logger.warning(f"No constraint comparison data available in {input_file}. Skipping figure.")
-            return
-    except Exception as e:
-         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
-         return
-        
-    logger.info("Rendering Figure: Constraint Adherence Comparison (EdgePrompt vs. Edge Baseline)...")
-    
-    # Check required columns
-    id_vars = [col for col in ["hardware_profile", "edge_llm_model_id"] if col in df.columns]
-    value_vars = [col for col in ["constraint_pass_rate_run4", "constraint_pass_rate_run3"] if col in df.columns]
-    if not id_vars or len(value_vars) != 2:
-        logger.error(f"Missing required columns in {input_file} for constraint comparison plot. Need grouping ({id_vars}) and value ({value_vars}) columns.")
-        return
+    Write a paper table as CSV without going through DataFrame.to_csv.
 
-    # Set up the figure
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # Reshape data for grouped bar chart
+    The tables are a handful of rows, so Python's csv module writes them
+    directly. The output matches to_csv's: minimal quoting, floats as the
+    shortest repr of their own dtype (502.0, and 0.6 for a float32 0.6), and
+    missing values as empty fields.
+    """
+    columns = []
+    for _, column in table_df.items():
+        values = column.to_numpy()
+        if values.dtype.kind == 'f':
+            # str() of a numpy float scalar is its shortest round-trip repr
+            columns.append(['' if np.isnan(value) else str(value) for value in values])
+        else:
+            columns.append(['' if pd.isna(value) else value for value in values])
+    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(table_df.columns)
+        writer.writerows(zip(*columns))
+
+def needs_rebuild(input_files: List[str], output_files: List[str]) -> bool:
+    """Return True if any output is missing or older than any of the inputs."""
     try:
-        melted_df = pd.melt(
-            df, 
-            id_vars=id_vars,
-            value_vars=value_vars,
-            var_name="scenario", 
-            value_name="adherence_rate"
-        )
-    except Exception as e:
-         logger.error(f"Error melting dataframe for plotting: {e}", exc_info=True)
-         plt.close(fig)
-         return
+        oldest_output = min(os.path.getmtime(path) for path in output_files)
+    except OSError:
+        return True
+    return any(os.path.getmtime(path) > oldest_output for path in input_files)
 
-    # Replace scenario names for better labels
-    melted_df["scenario"] = melted_df["scenario"].replace({
-        "constraint_pass_rate_run4": "EdgePrompt (Run 4)",
-        "constraint_pass_rate_run3": "Edge Baseline (Run 3)"
-    })
-    
-    # Determine grouping variable for x-axis
-    x_group = "edge_llm_model_id" if "edge_llm_model_id" in id_vars else id_vars[0]
+@lru_cache(maxsize=None)
+def load_plotting():
+    """
+    Import and configure matplotlib on first use, returning pyplot.
 
-    # Create grouped bar chart
-    try:
-        sns.barplot(
-            x=x_group, 
-            y="adherence_rate",
-            hue="scenario", 
-            data=melted_df,
-            ax=ax,
-            palette="viridis"
-        )
-    except Exception as e:
-         logger.error(f"Error creating barplot: {e}", exc_info=True)
-         plt.close(fig)
-         return
+    Deferred so runs with nothing to render (missing or up-to-date outputs)
+    never pay for importing matplotlib and seaborn.
+    """
+    import matplotlib
+    
+    # Use non-interactive backend (doesn't require display)
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    # Set up publication-quality figure settings
+    plt.rcParams['figure.figsize'] = (10, 6)
+    plt.rcParams['figure.dpi'] = 300
+    plt.rcParams['savefig.dpi'] = 150 # Draft resolution; --hi-dpi saves at PUBLICATION_DPI
+    plt.rcParams['font.size'] = 12
+    plt.rcParams['axes.titlesize'] = 14
+    plt.rcParams['axes.labelsize'] = 12
+    plt.rcParams['xtick.labelsize'] = 10
+    plt.rcParams['ytick.labelsize'] = 10
+    plt.rcParams['legend.fontsize'] = 10
+    plt.rcParams['figure.titlesize'] = 16
+    return plt
+
+# Single figure reused by every render, created on first use
+_FIGURE = None
+
+def get_figure(figsize: Tuple[float, float]) -> Tuple['plt.Figure', 'plt.Axes']:
+    """
+    Return the shared figure, cleared and resized, with one fresh axes.
 
-    # Add labels and title
-    ax.set_xlabel("EdgeLLM Model")
-    ax.set_ylabel("Constraint Adherence Rate (%)")
-    ax.set_title("Constraint Adherence: EdgeLLM EdgePrompt vs. EdgeLLM Baseline")
-    ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.0f}%')) # Format y-axis as percentage
+    Reusing one figure avoids building a new figure and canvas per render;
+    callers clear it with fig.clf() instead of closing it.
+    """
+    global _FIGURE
+    plt = load_plotting()
+    if _FIGURE is None:
+        # Constrained layout fits the axes as part of each draw, so renders
+        # need no separate tight_layout pass before saving
+        _FIGURE = plt.figure(figsize=figsize, layout='constrained')
+    else:
+        _FIGURE.clf()
+        _FIGURE.set_size_inches(figsize)
+        plt.figure(_FIGURE.number)
+    return _FIGURE, _FIGURE.add_subplot(111)
+
+def close_figure() -> None:
+    """Close the shared figure, if any render created it."""
+    global _FIGURE
+    if _FIGURE is not None:
+        load_plotting().close(_FIGURE)
+        _FIGURE = None
+
+def save_figure(fig: 'plt.Figure', output_file: str) -> None:
+    """
+    Encode the figure to PNG in memory through its Agg canvas, then write it in one go.
 
-    # Add value labels on bars
-    try:
-        for container in ax.containers:
-            ax.bar_label(container, fmt='%.1f%%', padding=3)
-    except Exception as e:
-         logger.warning(f"Could not add bar labels: {e}")
+    The file is replaced atomically, so an interrupted save never leaves a
+    truncated PNG that needs_rebuild would consider up to date.
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', **PNG_SAVE_KWARGS)
+    temp_file = f'{output_file}.tmp'
+    with open(temp_file, 'wb') as f:
+        f.write(buffer.getbuffer())
+    os.replace(temp_file, output_file)
+
+def plot_grouped_bars(ax: 'plt.Axes', df: pd.DataFrame, x_col: str, series: Dict[str, str]) -> None:
+    """
+    Draw one group of bars per x_col value, with one bar per series column.
 
-    # Add gridlines
-    ax.grid(True, axis='y', linestyle='--', alpha=0.7)
-    ax.legend(title='Method')
-    plt.xticks(rotation=45, ha="right")
+    Rows sharing an x_col value (e.g. several hardware profiles) are averaged,
+    as seaborn's barplot estimator did. No error bars are drawn: the tables
+    are already aggregated, so there is no per-sample spread to show.
 
-    # Adjust layout and save
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'Figure_Paper_EdgePrompt_vs_Baseline_Constraints.png')
-    try:
-        plt.savefig(output_file)
-        logger.info(f"Saved constraint adherence comparison figure to {output_file}")
-    except Exception as e:
-         logger.error(f"Failed to save figure {output_file}: {e}")
-    finally:
-        plt.close(fig)
+    Args:
+        ax: Axes to draw on
+        df: Processed comparison table
+        x_col: Column grouping the bars along the x-axis
+        series: Mapping of value columns to their legend labels, in bar order
+    """
+    import seaborn as sns
+    
+    # Bars are drawn at float32 precision whichever source the table came from
+    values = df[list(series)].astype(np.float32)
+    grouped = values.groupby(df[x_col], observed=True, sort=False)
+    means = grouped.mean()
+    positions = np.arange(len(means))
+    width = 0.8 / len(series)
+    colors = sns.color_palette("viridis", len(series), desat=0.75)
+    for i, (col, label) in enumerate(series.items()):
+        offsets = positions + (i - (len(series) - 1) / 2) * width
+        ax.bar(offsets, means[col].to_numpy(), width, label=label, color=colors[i])
+    ax.set_xticks(positions)
+    ax.set_xticklabels(means.index.astype(str))
+
+def label_bars(ax: 'plt.Axes', fmt: str) -> None:
+    """
+    Label each bar with its height, 3 points above the bar.
 
-def render_quality_vs_reference(data_dir: str, output_dir: str, logger: logging.Logger) -> None:
+    Matches bar_label's placement for the non-negative values plotted here,
+    without its per-container error bar and orientation handling.
+    """
+    for container in ax.containers:
+        for rect in container:
+            height = rect.get_height()
+            if np.isnan(height):
+                continue
+            ax.annotate(fmt % height, (rect.get_x() + rect.get_width() / 2, height),
+                        xytext=(0, 3), textcoords='offset points', ha='center', va='bottom')
+
+def render_comparison_figure(data_dir: str, output_dir: str, logger: logging.Logger, force: bool, *,
+                             table: str, series: Dict[str, str], subject: str, figure_name: str,
+                             ylabel: str, title: str, output_name: str, label_fmt: str,
+                             percent_axis: bool = False) -> None:
     """
-    Render Figure: Quality Comparison vs Reference (CloudLLM).
+    Render a grouped bar figure comparing EdgeLLM methods per model from one processed table.
     
     Args:
         data_dir: Directory containing processed data
         output_dir: Directory to save figures
         logger: Logger instance
+        force: Regenerate the output even if it is newer than its input
+        table: Processed table to plot
+        series: Mapping of value columns to their legend labels, in bar order
+        subject: Short description used in log messages (e.g. 'safety comparison')
+        figure_name: Figure name logged when rendering starts
+        ylabel: Y-axis label
+        title: Figure title
+        output_name: File name of the saved figure
+        label_fmt: %-format of the bar value labels
+        percent_axis: Format y-axis ticks as percentages
     """
-    input_file = os.path.join(data_dir, 'quality_vs_reference.csv')
+    input_file = processed_table_path(data_dir, table)
     
     if not os.path.exists(input_file):
-        logger.warning(f"Quality comparison data not found: {input_file}. Skipping figure generation.")
+        logger.warning(f"{subject.capitalize()} data not found: {input_file}. Skipping figure generation.")
+        return
+    
+    output_file = os.path.join(output_dir, output_name)
+    if not force and not needs_rebuild([input_file], [output_file]):
+        logger.info(f"{os.path.basename(output_file)} is up to date. Skipping.")
         return
         
     try:
-        df = pd.read_csv(input_file)
+        df = read_processed_table(input_file, ["hardware_profile", "edge_llm_model_id", *series])
         if df.empty:
-            logger.warning(f"No quality comparison data available in {input_file}. Skipping figure.")
+            logger.warning(f"No {subject} data available in {input_file}. Skipping figure.")
             return
     except Exception as e:
          logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
          return
         
-    logger.info("Rendering Figure: Quality vs Reference Comparison...")
+    logger.info(f"Rendering Figure: {figure_name}...")
     
     # Check required columns
-    id_vars = [col for col in ["hardware_profile", "edge_llm_model_id"] if col in df.columns]
-    value_vars = [col for col in ["agreement_score_run3_vs_ref", "agreement_score_run4_vs_ref"] if col in df.columns]
-    if not id_vars or len(value_vars) != 2:
-        logger.error(f"Missing required columns in {input_file} for quality comparison plot. Need grouping ({id_vars}) and value ({value_vars}) columns.")
+    columns = set(df.columns)
+    id_vars = [col for col in ["hardware_profile", "edge_llm_model_id"] if col in columns]
+    value_vars = [col for col in series if col in columns]
+    if not id_vars or len(value_vars) != len(series):
+        logger.error(f"Missing required columns in {input_file} for {subject} plot. Need grouping ({id_vars}) and value ({value_vars}) columns.")
         return
 
     # Set up the figure
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    # Reshape data for grouped bar chart
-    try:
-        melted_df = pd.melt(
-            df, 
-            id_vars=id_vars,
-            value_vars=value_vars,
-            var_name="method", 
-            value_name="agreement_score"
-        )
-    except Exception as e:
-         logger.error(f"Error melting dataframe for plotting: {e}", exc_info=True)
-         plt.close(fig)
-         return
-
-    # Replace scenario names for better labels
-    melted_df["method"] = melted_df["method"].replace({
-        "agreement_score_run4_vs_ref": "EdgePrompt (Run 4)",
-        "agreement_score_run3_vs_ref": "Edge Baseline (Run 3)"
-    })
+    plt = load_plotting()
+    fig, ax = get_figure(figsize=(12, 7))
     
     # Determine grouping variable for x-axis
     x_group = "edge_llm_model_id" if "edge_llm_model_id" in id_vars else id_vars[0]
-
+    
     # Create grouped bar chart
     try:
-        sns.barplot(
-            x=x_group, 
-            y="agreement_score",
-            hue="method", 
-            data=melted_df,
-            ax=ax,
-            palette="viridis"
-        )
+        plot_grouped_bars(ax, df, x_group, series)
     except Exception as e:
          logger.error(f"Error creating barplot: {e}", exc_info=True)
-         plt.close(fig)
+         fig.clf()
          return
-
+    
     # Add labels and title
     ax.set_xlabel("EdgeLLM Model")
-    ax.set_ylabel("Agreement Score with CloudLLM Reference")
-    ax.set_title("Quality vs Reference: EdgeLLM Methods Compared to CloudLLM")
-
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    if percent_axis:
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'{x:.0f}%')) # Format y-axis as percentage
+    
     # Add value labels on bars
     try:
-        for container in ax.containers:
-            ax.bar_label(container, fmt='%.3f', padding=3)
+        label_bars(ax, label_fmt)
     except Exception as e:
-         logger.warning(f"Could not add bar labels: {e}")
-
+         logger.warning(f"Could not add bar labels: {e}") # Non-critical error
+    
     # Add gridlines
     ax.grid(True, axis='y', linestyle='--', alpha=0.7)
     ax.legend(title='Method')
-    plt.xticks(rotation=45, ha="right")
-
-    # Adjust layout and save
-    plt.tight_layout()
-    output_file = os.path.join(output_dir, 'Figure_Paper_Quality_vs_Reference.png')
+    plt.xticks(rotation=45, ha="right") # Rotate labels if they overlap
+    
+    # Save (constrained layout adjusts the axes while drawing)
     try:
-        plt.savefig(output_file)
-        logger.info(f"Saved quality comparison figure to {output_file}")
+        save_figure(fig, output_file)
+        logger.info(f"Saved {subject} figure to {output_file}")
     except Exception as e:
          logger.error(f"Failed to save figure {output_file}: {e}")
     finally:
-        plt.close(fig)
+        fig.clf() # Ensure figure is cleared for the next render
+
+def render_edgeprompt_vs_baseline_safety(data_dir: str, output_dir: str, logger: logging.Logger, force: bool = False) -> None:
+    """Render Figure: Safety Effectiveness Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline)."""
+    render_comparison_figure(
+        data_dir, output_dir, logger, force,
+        table='edgeprompt_vs_baseline_safety',
+        series={
+            "safety_violation_rate_run4": "EdgePrompt (Run 4)",
+            "safety_violation_rate_run3": "Edge Baseline (Run 3)"
+        },
+        subject="safety comparison",
+        figure_name="Safety Effectiveness Comparison (EdgePrompt vs. Edge Baseline)",
+        ylabel="Safety Violation Rate (%)",
+        title="Safety Effectiveness: EdgeLLM EdgePrompt vs. EdgeLLM Baseline",
+        output_name='Figure_Paper_EdgePrompt_vs_Baseline_Safety.png',
+        label_fmt='%.1f%%',
+        percent_axis=True
+    )
 
-def create_edgeprompt_vs_baseline_token_table(data_dir: str, output_dir: str, logger: logging.Logger) -> None:
+def render_edgeprompt_vs_baseline_constraint(data_dir: str, output_dir: str, logger: logging.Logger, force: bool = False) -> None:
+    """Render Figure: Constraint Adherence Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline)."""
+    render_comparison_figure(
+        data_dir, output_dir, logger, force,
+        table='edgeprompt_vs_baseline_constraint',
+        series={
+            "constraint_pass_rate_run4": "EdgePrompt (Run 4)",
+            "constraint_pass_rate_run3": "Edge Baseline (Run 3)"
+        },
+        subject="constraint comparison",
+        figure_name="Constraint Adherence Comparison (EdgePrompt vs. Edge Baseline)",
+        ylabel="Constraint Adherence Rate (%)",
+        title="Constraint Adherence: EdgeLLM EdgePrompt vs. EdgeLLM Baseline",
+        output_name='Figure_Paper_EdgePrompt_vs_Baseline_Constraints.png',
+        label_fmt='%.1f%%',
+        percent_axis=True
+    )
+
+def render_quality_vs_reference(data_dir: str, output_dir: str, logger: logging.Logger, force: bool = False) -> None:
+    """Render Figure: Quality Comparison vs Reference (CloudLLM)."""
+    render_comparison_figure(
+        data_dir, output_dir, logger, force,
+        table='quality_vs_reference',
+        series={
+            "agreement_score_run3_vs_ref": "Edge Baseline (Run 3)",
+            "agreement_score_run4_vs_ref": "EdgePrompt (Run 4)"
+        },
+        subject="quality comparison",
+        figure_name="Quality vs Reference Comparison",
+        ylabel="Agreement Score with CloudLLM Reference",
+        title="Quality vs Reference: EdgeLLM Methods Compared to CloudLLM",
+        output_name='Figure_Paper_Quality_vs_Reference.png',
+        label_fmt='%.3f'
+    )
+
+def create_edgeprompt_vs_baseline_token_table(data_dir: str, output_dir: str, logger: logging.Logger, force: bool = False) -> None:
     """
     Create Table: Token Usage Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline).
     
@@ -374,24 +445,19 @@ def create_edgeprompt_vs_baseline_token_table(data_dir: str, output_dir: str, lo
         data_dir: Directory containing processed data
         output_dir: Directory to save tables
         logger: Logger instance
+        force: Regenerate the output even if it is newer than its input
     """
-    input_file = os.path.join(data_dir, 'edgeprompt_vs_baseline_token_usage.csv')
+    input_file = processed_table_path(data_dir, 'edgeprompt_vs_baseline_token_usage')
     
     if not os.path.exists(input_file):
         logger.warning(f"Token comparison data not found: {input_file}. Skipping table generation.")
         return
-        
-    try:
-        df = pd.read_csv(input_file)
-        if df.empty:
-            logger.warning(f"No token comparison data available in {input_file}. Skipping table.")
-            return
-    except Exception as e:
-         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
-         return
-        
-    logger.info("Creating Table: Token Usage Comparison (EdgePrompt vs. Edge Baseline)...")
     
+    output_file = os.path.join(output_dir, 'Table_Paper_EdgePrompt_vs_Baseline_TokenCompare.csv')
+    if not force and not needs_rebuild([input_file], [output_file]):
+        logger.info(f"{os.path.basename(output_file)} is up to date. Skipping.")
+        return
+        
     # Select and rename columns for the table
     table_cols = {
         'edge_llm_model_id': 'EdgeLLM Model',
@@ -403,34 +469,44 @@ def create_edgeprompt_vs_baseline_token_table(data_dir: str, output_dir: str, lo
         'avg_tokens_run1': 'CloudLLM Ref Tokens (Avg)',
         'token_ratio_run4_vs_run1': 'EdgePrompt vs Ref Ratio (R4/R1)'
     }
+    
+    try:
+        df = read_processed_table(input_file, list(table_cols))
+        if df.empty:
+            logger.warning(f"No token comparison data available in {input_file}. Skipping table.")
+            return
+    except Exception as e:
+         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
+         return
+        
+    logger.info("Creating Table: Token Usage Comparison (EdgePrompt vs. Edge Baseline)...")
+    
     # Ensure columns exist before selecting/renaming
-    cols_to_select = [col for col in table_cols.keys() if col in df.columns]
+    columns = set(df.columns)
+    cols_to_select = [col for col in table_cols.keys() if col in columns]
     if len(cols_to_select) < 4: # At least need model, run3, run4 tokens
          logger.error(f"Missing essential columns in {input_file} for token table. Found: {df.columns.tolist()}")
          return
 
-    table_df = df[cols_to_select].rename(columns=table_cols)
+    # Relabel the selected frame in place rather than copying it again via rename
+    table_df = df[cols_to_select]
+    table_df.columns = [table_cols[col] for col in cols_to_select]
+    table_columns = set(table_df.columns)
     
-    # Format numeric columns
+    # Format numeric columns in one rounding pass, then one cast for token counts
     token_cols = ['EdgePrompt Tokens (Avg)', 'Edge Baseline Tokens (Avg)', 'Token Difference (R4-R3)', 'CloudLLM Ref Tokens (Avg)']
-    for col in token_cols:
-         if col in table_df.columns:
-              table_df[col] = table_df[col].round(0).astype(int)
-    
     ratio_cols = ['Token Ratio (R4/R3)', 'EdgePrompt vs Ref Ratio (R4/R1)']
-    for col in ratio_cols:
-         if col in table_df.columns:
-             table_df[col] = table_df[col].round(2)
+    table_df = table_df.round({**dict.fromkeys(token_cols, 0), **dict.fromkeys(ratio_cols, 2)})
+    table_df = table_df.astype({col: int for col in token_cols if col in table_columns})
     
     # Save as CSV
-    output_file = os.path.join(output_dir, 'Table_Paper_EdgePrompt_vs_Baseline_TokenCompare.csv')
     try:
-        table_df.to_csv(output_file, index=False)
+        write_table_csv(table_df, output_file)
         logger.info(f"Saved token usage comparison table to {output_file}")
     except Exception as e:
          logger.error(f"Failed to save table {output_file}: {e}")
 
-def create_edgeprompt_vs_baseline_latency_table(data_dir: str, output_dir: str, logger: logging.Logger) -> None:
+def create_edgeprompt_vs_baseline_latency_table(data_dir: str, output_dir: str, logger: logging.Logger, force: bool = False) -> None:
     """
     Create Table: Latency Comparison (EdgeLLM EdgePrompt vs EdgeLLM Baseline).
     
@@ -438,24 +514,19 @@ def create_edgeprompt_vs_baseline_latency_table(data_dir: str, output_dir: str,
         data_dir: Directory containing processed data
         output_dir: Directory to save tables
         logger: Logger instance
+        force: Regenerate the output even if it is newer than its input
     """
-    input_file = os.path.join(data_dir, 'edgeprompt_vs_baseline_latency.csv')
+    input_file = processed_table_path(data_dir, 'edgeprompt_vs_baseline_latency')
     
     if not os.path.exists(input_file):
         logger.warning(f"Latency comparison data not found: {input_file}. Skipping table generation.")
         return
-        
-    try:
-        df = pd.read_csv(input_file)
-        if df.empty:
-            logger.warning(f"No latency comparison data available in {input_file}. Skipping table.")
-            return
-    except Exception as e:
-         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
-         return
-        
-    logger.info("Creating Table: Latency Comparison (EdgePrompt vs. Edge Baseline)...")
     
+    output_file = os.path.join(output_dir, 'Table_Paper_EdgePrompt_vs_Baseline_LatencyCompare.csv')
+    if not force and not needs_rebuild([input_file], [output_file]):
+        logger.info(f"{os.path.basename(output_file)} is up to date. Skipping.")
+        return
+        
     # Select and rename columns for the table
     table_cols = {
         'edge_llm_model_id': 'EdgeLLM Model',
@@ -467,32 +538,62 @@ def create_edgeprompt_vs_baseline_latency_table(data_dir: str, output_dir: str,
         'avg_latency_run1': 'CloudLLM Ref Latency (ms)',
         'latency_ratio_run4_vs_run1': 'EdgePrompt vs Ref Ratio (R4/R1)'
     }
-    cols_to_select = [col for col in table_cols.keys() if col in df.columns]
+    
+    try:
+        df = read_processed_table(input_file, list(table_cols))
+        if df.empty:
+            logger.warning(f"No latency comparison data available in {input_file}. Skipping table.")
+            return
+    except Exception as e:
+         logger.error(f"Failed to load or process {input_file}: {e}", exc_info=True)
+         return
+        
+    logger.info("Creating Table: Latency Comparison (EdgePrompt vs. Edge Baseline)...")
+    
+    columns = set(df.columns)
+    cols_to_select = [col for col in table_cols.keys() if col in columns]
     if len(cols_to_select) < 4: # At least need model, run3, run4 latency
          logger.error(f"Missing essential columns in {input_file} for latency table. Found: {df.columns.tolist()}")
          return
 
-    table_df = df[cols_to_select].rename(columns=table_cols)
+    # Relabel the selected frame in place rather than copying it again via rename
+    table_df = df[cols_to_select]
+    table_df.columns = [table_cols[col] for col in cols_to_select]
 
-    # Format numeric columns
+    # Format numeric columns in one rounding pass
     latency_cols = ['EdgePrompt Latency (ms)', 'Edge Baseline Latency (ms)', 'Latency Difference (ms R4-R3)', 'CloudLLM Ref Latency (ms)']
-    for col in latency_cols:
-        if col in table_df.columns:
-            table_df[col] = table_df[col].round(1)
-    
     ratio_cols = ['Latency Ratio (R4/R3)', 'EdgePrompt vs Ref Ratio (R4/R1)']
-    for col in ratio_cols:
-        if col in table_df.columns:
-            table_df[col] = table_df[col].round(2)
+    table_df = table_df.round({**dict.fromkeys(latency_cols, 1), **dict.fromkeys(ratio_cols, 2)})
     
     # Save as CSV
-    output_file = os.path.join(output_dir, 'Table_Paper_EdgePrompt_vs_Baseline_LatencyCompare.csv')
     try:
-        table_df.to_csv(output_file, index=False)
+        write_table_csv(table_df, output_file)
         logger.info(f"Saved latency comparison table to {output_file}")
     except Exception as e:
          logger.error(f"Failed to save table {output_file}: {e}")
 
+# Phase 1 four-run comparison renderers, independent of each other
+RENDERERS = (
+    render_edgeprompt_vs_baseline_safety,
+    render_edgeprompt_vs_baseline_constraint,
+    render_quality_vs_reference,
+    create_edgeprompt_vs_baseline_token_table,
+    create_edgeprompt_vs_baseline_latency_table,
+)
+
+def run_renderer(renderer: Callable[..., None], args: argparse.Namespace) -> None:
+    """
+    Run one renderer in a worker process.
+
+    Loggers and rcParams changes made in main do not carry over to spawned
+    workers, so both are set up again from the parsed arguments.
+    """
+    logger = setup_logging(args.log_level)
+    if args.hi_dpi:
+        load_plotting().rcParams['savefig.dpi'] = PUBLICATION_DPI
+    renderer(args.data_dir, args.output_dir, logger, args.force)
+    close_figure()
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -513,6 +614,25 @@ def parse_args():
         help='Directory for saving generated figures and tables'
     )
     
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Regenerate all figures and tables, even those newer than their data'
+    )
+    
+    parser.add_argument(
+        '--hi-dpi',
+        action='store_true',
+        help=f'Save figures at {PUBLICATION_DPI} DPI for publication (implies --force)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=min(len(RENDERERS), os.cpu_count() or 1),
+        help='Number of processes rendering figures in parallel (1 renders in-process)'
+    )
+    
     parser.add_argument(
         '--log-level',
         type=str,
@@ -540,12 +660,21 @@ def main():
     logger.info(f"Generating Phase 1 figures from data in: {args.data_dir}")
     logger.info(f"Saving figures/tables to: {args.output_dir}")
     
+    # Publication runs regenerate everything, replacing draft-resolution figures
+    if args.hi_dpi:
+        load_plotting().rcParams['savefig.dpi'] = PUBLICATION_DPI
+        args.force = True
+    
     # Call rendering functions for Phase 1 four-run comparisons
-    render_edgeprompt_vs_baseline_safety(args.data_dir, args.output_dir, logger)
-    render_edgeprompt_vs_baseline_constraint(args.data_dir, args.output_dir, logger)
-    render_quality_vs_reference(args.data_dir, args.output_dir, logger)
-    create_edgeprompt_vs_baseline_token_table(args.data_dir, args.output_dir, logger)
-    create_edgeprompt_vs_baseline_latency_table(args.data_dir, args.output_dir, logger)
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(run_renderer, renderer, args) for renderer in RENDERERS]
+            for future in futures:
+                future.result()
+    else:
+        for renderer in RENDERERS:
+            renderer(args.data_dir, args.output_dir, logger, args.force)
+        close_figure()
     
     logger.info("Figure generation complete.")
 
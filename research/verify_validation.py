@@ -11,11 +11,17 @@ import json
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from runner.template_engine import TemplateEngine
 from runner.evaluation_engine import EvaluationEngine
 from runner.config_loader import ConfigLoader
 from runner.metrics_collector import MetricsCollector
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,15 +32,45 @@ logging.basicConfig(
 )
 logger = logging.getLogger("validation_verification")
 
-def verify_json_processing():
-    """Verify JSON processing from LLM responses with various formats"""
-    from runner.runner_core import RunnerCore
-    import re
+def _fenced_json_start(text: str) -> int:
+    """
+    Return the index of the '{' opening a markdown code block (```json ... ```), or -1.
     
-    # Sample LLM outputs in various formats
-    test_responses = [
-        # JSON in markdown code block
-        """
+    The fences are fixed literals, so plain substring searches find them.
+    """
+    fence = text.find('```')
+    if fence == -1:
+        return -1
+    end = text.find('```', fence + 3)
+    if end == -1:
+        return -1
+    body = fence + 3
+    if text.startswith('json', body):
+        body += 4
+    start = text.find('{', body, end)
+    # Only whitespace may separate the fence header from the object
+    if start == -1 or text[body:start].strip():
+        return -1
+    return start
+
+def _loads(data):
+    """Decode JSON with orjson when available, falling back to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals the stdlib parser accepts
+            pass
+    return json.loads(data)
+
+# Decodes a JSON value starting at an index, returning where it ended, so the
+# object is located and parsed in one pass
+_DECODER = json.JSONDecoder()
+
+# Sample LLM outputs in various formats
+_JSON_TEST_RESPONSES = (
+    # JSON in markdown code block
+    """
         Here's the teacher request:
         
         ```json
@@ -50,9 +86,9 @@ def verify_json_processing():
         }
         ```
         """,
-        
-        # JSON with backticks but no language specifier
-        """
+    
+    # JSON with backticks but no language specifier
+    """
         ```
         {
           "topic": "Traditional Games",
@@ -66,9 +102,9 @@ def verify_json_processing():
         }
         ```
         """,
-        
-        # Direct JSON (no markdown)
-        """{
+    
+    # Direct JSON (no markdown)
+    """{
           "topic": "Water Cycle",
           "learning_objective": "Explain the stages of water cycle",
           "content_type": "diagram description",
@@ -78,49 +114,79 @@ def verify_json_processing():
             "safety_rules": ["Scientific accuracy"]
           }
         }"""
-    ]
+)
+
+# Sample validation outputs in various formats
+_VALIDATION_TEST_CASES = (
+    # Clean JSON
+    '{"passed": true, "score": 8, "feedback": "Good answer with appropriate vocabulary"}',
+    
+    # JSON in markdown
+    """```json
+        {
+          "passed": false,
+          "score": 3,
+          "feedback": "Answer doesn't address the question properly"
+        }
+        ```""",
+    
+    # Text with extractable fields
+    """
+        Evaluation result:
+        - passed: false
+        - score: 5
+        - feedback: The student needs to work on clarity.
+        """,
+    
+    # Alternative field names/formats
+    """
+        {"valid": true, "score": 7.5, "feedback": "Mostly correct but could expand more"}
+        """
+)
+
+# Fields every extracted validation result must carry besides passed/valid
+_REQUIRED_RESULT_FIELDS = frozenset(("score", "feedback"))
+
+def verify_json_processing():
+    """Verify JSON processing from LLM responses with various formats"""
+    from runner.runner_core import RunnerCore
     
     success_count = 0
     
-    for i, response in enumerate(test_responses):
-        logger.info(f"Verifying JSON processing scenario {i+1}...")
-        try:
-            # First try direct parsing
+    for i, response in enumerate(_JSON_TEST_RESPONSES):
+        logger.info("Verifying JSON processing scenario %d...", i+1)
+        # First try direct parsing, but only when the response could plausibly
+        # be a bare JSON document; prose responses skip the decode-and-raise
+        if response.lstrip()[:1] in ('{', '['):
             try:
-                json_data = json.loads(response)
+                json_data = _loads(response)
                 logger.info("Direct JSON processing succeeded")
                 success_count += 1
                 continue
             except json.JSONDecodeError:
-                # If direct parsing fails, try to extract JSON from markdown code blocks
-                try:
-                    # Look for JSON in markdown code blocks (```json ... ```)
-                    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-                    if json_match:
-                        json_text = json_match.group(1)
-                        logger.info(f"Found JSON in markdown code block")
-                        json_data = json.loads(json_text)
-                        success_count += 1
-                        continue
-                    
-                    # Look for JSON objects without code blocks if not found in code blocks
-                    json_match = re.search(r'\{(?:[^{}]|(?:\{[^{}]*\}))*\}', response, re.DOTALL)
-                    if json_match:
-                        json_text = json_match.group(0)
-                        logger.info(f"Found JSON object in text")
-                        json_data = json.loads(json_text)
-                        success_count += 1
-                        continue
-                    else:
-                        raise Exception("No JSON found in output")
-                except Exception as e:
-                    logger.error(f"Error processing response: {str(e)}")
-                    
-        except Exception as e:
-            logger.error(f"Scenario {i+1} validation failed: {str(e)}")
+                pass
+
+        # If direct parsing fails, look for JSON in markdown code blocks
+        # (```json ... ```), then for a JSON object anywhere in the text
+        json_start = _fenced_json_start(response)
+        if json_start != -1:
+            logger.info("Found JSON in markdown code block")
+        else:
+            json_start = response.find('{')
+            if json_start == -1:
+                logger.error("Error processing response: No JSON found in output")
+                continue
+            logger.info("Found JSON object in text")
+
+        try:
+            json_data, _ = _DECODER.raw_decode(response, json_start)
+        except json.JSONDecodeError as e:
+            logger.error("Error processing response: %s", e)
+            continue
+        success_count += 1
     
-    logger.info(f"JSON processing validation: {success_count}/{len(test_responses)} scenarios validated")
-    return success_count == len(test_responses)
+    logger.info("JSON processing validation: %d/%d scenarios validated", success_count, len(_JSON_TEST_RESPONSES))
+    return success_count == len(_JSON_TEST_RESPONSES)
 
 def verify_template_processing():
     """Verify template processing with mixed variable types"""
@@ -151,7 +217,7 @@ def verify_template_processing():
                   processed_prompt = processed_prompt.replace(placeholder, value_str)
              else:
                   # Handle missing variables (optional, for robustness test)
-                  logger.warning(f"Variable '{var_name}' found in pattern but not provided for test.")
+                  logger.warning("Variable '%s' found in pattern but not provided for test.", var_name)
                   placeholder = f"[{var_name}]"
                   processed_prompt = processed_prompt.replace(placeholder, "") # Replace with empty string
 
@@ -161,44 +227,16 @@ def verify_template_processing():
             logger.info("Template processing (substitution) validation passed")
             return True
         else:
-            logger.error(f"Template substitution mismatch. Expected: '{expected}', Got: '{processed_prompt}'")
+            logger.error("Template substitution mismatch. Expected: '%s', Got: '%s'", expected, processed_prompt)
             return False
             
     except Exception as e:
-        logger.error(f"Template substitution validation failed: {str(e)}")
+        logger.error("Template substitution validation failed: %s", e)
         return False
 
 def verify_validation_parsing():
     """Verify validation result extraction from various LLM output formats"""
     
-    # Sample validation outputs in various formats
-    test_validations = [
-        # Clean JSON
-        '{"passed": true, "score": 8, "feedback": "Good answer with appropriate vocabulary"}',
-        
-        # JSON in markdown
-        """```json
-        {
-          "passed": false,
-          "score": 3,
-          "feedback": "Answer doesn't address the question properly"
-        }
-        ```""",
-        
-        # Text with extractable fields
-        """
-        Evaluation result:
-        - passed: false
-        - score: 5
-        - feedback: The student needs to work on clarity.
-        """,
-        
-        # Alternative field names/formats
-        """
-        {"valid": true, "score": 7.5, "feedback": "Mostly correct but could expand more"}
-        """
-    ]
-    
     # Minimal dependencies needed for EvaluationEngine
     try:
         dummy_config_path = os.path.join(os.path.dirname(__file__), 'dummy_config.json')
@@ -208,30 +246,30 @@ def verify_validation_parsing():
         # Provide a dummy API key as EvaluationEngine might check for it
         engine = EvaluationEngine(template_engine, metrics_collector, anthropic_api_key="dummy_key")
     except Exception as e:
-        logger.error(f"Failed to initialize EvaluationEngine dependencies: {e}")
+        logger.error("Failed to initialize EvaluationEngine dependencies: %s", e)
         return False
 
     success_count = 0
     
-    for i, validation in enumerate(test_validations):
-        logger.info(f"Verifying validation extraction scenario {i+1}...")
+    for i, validation in enumerate(_VALIDATION_TEST_CASES):
+        logger.info("Verifying validation extraction scenario %d...", i+1)
         try:
             # Use the internal parsing method directly for this test
             result = engine._parse_json_from_llm_output(validation)
             
             # Verify we correctly extracted the required fields (or alternatives like 'valid')
             passed_key = 'passed' if 'passed' in result else 'valid' if 'valid' in result else None
-            if passed_key and "score" in result and "feedback" in result:
-                logger.info(f"Successfully extracted: {passed_key}={result[passed_key]}, score={result['score']}")
+            if passed_key and _REQUIRED_RESULT_FIELDS <= result.keys():
+                logger.info("Successfully extracted: %s=%s, score=%s", passed_key, result[passed_key], result['score'])
                 success_count += 1
             else:
-                logger.error(f"Missing required fields in extracted result: {result}")
+                logger.error("Missing required fields in extracted result: %s", result)
                 
         except Exception as e:
-            logger.error(f"Scenario {i+1} validation failed: {str(e)}")
+            logger.error("Scenario %d validation failed: %s", i+1, e)
     
-    logger.info(f"Validation extraction: {success_count}/{len(test_validations)} scenarios validated")
-    return success_count == len(test_validations)
+    logger.info("Validation extraction: %d/%d scenarios validated", success_count, len(_VALIDATION_TEST_CASES))
+    return success_count == len(_VALIDATION_TEST_CASES)
 
 def main():
     """Run all verification checks"""
@@ -245,18 +283,26 @@ def main():
     
     all_verified = True
     
-    for check_name, check_func in verification_checks:
-        logger.info(f"Verifying: {check_name}")
-        try:
-            result = check_func()
-            if result:
-                logger.info(f"✅ {check_name}: VERIFIED")
-            else:
-                logger.error(f"❌ {check_name}: VERIFICATION FAILED")
+    # The checks are independent, so run them side by side; results are
+    # reported as each one finishes
+    with ThreadPoolExecutor(max_workers=len(verification_checks)) as executor:
+        futures = {}
+        for check_name, check_func in verification_checks:
+            logger.info("Verifying: %s", check_name)
+            futures[executor.submit(check_func)] = check_name
+        
+        for future in as_completed(futures):
+            check_name = futures[future]
+            try:
+                result = future.result()
+                if result:
+                    logger.info("✅ %s: VERIFIED", check_name)
+                else:
+                    logger.error("❌ %s: VERIFICATION FAILED", check_name)
+                    all_verified = False
+            except Exception as e:
+                logger.error("❌ %s: ERROR - %s", check_name, e)
                 all_verified = False
-        except Exception as e:
-            logger.error(f"❌ {check_name}: ERROR - {str(e)}")
-            all_verified = False
     
     if all_verified:
         logger.info("🎉 EdgePrompt validation architecture successfully verified!")